@@ -5,7 +5,7 @@ This module analyzes activity data to provide training load management
 """
 
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from garmindb.data.repositories.base import HealthRepository
@@ -240,11 +240,11 @@ class ActivityAnalyzer:
 
         return daily_loads, confidence_score
 
-    def _calculate_ema(self, values: List[float], window: int) -> float:
+    def _calculate_ema(self, values: Sequence[float], window: int) -> float:
         """Calculate exponential moving average.
 
         Args:
-            values: Ordered list of values (oldest to newest)
+            values: Ordered sequence of values (oldest to newest), e.g. a list or array('d')
             window: EMA window size
 
         Returns:
@@ -254,8 +254,10 @@ class ActivityAnalyzer:
             return 0.0
 
         alpha = 2 / (window + 1)
-        ema = values[0]
-        for value in values[1:]:
+        # Iterate instead of slicing values[1:], which would copy the whole history
+        it = iter(values)
+        ema = next(it)
+        for value in it:
             ema = alpha * value + (1 - alpha) * ema
         return ema
 
@@ -306,7 +308,7 @@ class ActivityAnalyzer:
             confidence_score=round(confidence_score, 2),
         )
 
-    def _calculate_monotony(self, daily_loads: List[float]) -> Optional[float]:
+    def _calculate_monotony(self, daily_loads: Sequence[float]) -> Optional[float]:
         """Calculate training monotony (Mean / StdDev).
 
         Higher monotony = more repetitive training (risk of staleness).
@@ -314,19 +316,20 @@ class ActivityAnalyzer:
         A very high value (>10) indicates highly monotonous training.
 
         Args:
-            daily_loads: List of daily load values
+            daily_loads: Sequence of daily load values, e.g. a list or array('d')
 
         Returns:
             Monotony value or None if insufficient data (< 7 days)
         """
-        if len(daily_loads) < self.MIN_MONOTONY_DAYS:
+        count = len(daily_loads)
+        if count < self.MIN_MONOTONY_DAYS:
             return None
 
-        mean = sum(daily_loads) / len(daily_loads)
+        mean = sum(daily_loads) / count
         if mean == 0:
             return 0.0
 
-        variance = sum((x - mean) ** 2 for x in daily_loads) / len(daily_loads)
+        variance = sum((x - mean) ** 2 for x in daily_loads) / count
         std_dev = variance ** 0.5
 
         # When std_dev is zero (all identical loads), monotony is maximal
@@ -363,7 +366,7 @@ class ActivityAnalyzer:
             activities: Activities in the analysis period
 
         Returns:
-            Dict mapping sport name to SportSummary
+            Dict mapping sport name to SportSummary, in sport name order
         """
         # Group activities by sport
         sport_activities: Dict[str, List['ActivityRecord']] = {}
@@ -373,9 +376,9 @@ class ActivityAnalyzer:
                 sport_activities[sport] = []
             sport_activities[sport].append(activity)
 
-        # Build summaries
+        # Build summaries, inserted in name order so activities_by_sport comes out sorted
         summaries: Dict[str, SportSummary] = {}
-        for sport, acts in sport_activities.items():
+        for sport, acts in sorted(sport_activities.items()):
             count = len(acts)
             total_distance = sum(a.distance or 0 for a in acts)
             total_duration = sum(
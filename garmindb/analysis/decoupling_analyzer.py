@@ -22,6 +22,7 @@ import sqlite3
 import statistics
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from operator import attrgetter
 from typing import List, Optional, Sequence, Tuple
 
 from .models import Insight, InsightSeverity
@@ -250,7 +251,7 @@ class DecouplingAnalyzer:
                 analysed.append(rd)
 
         steady = sorted((r for r in analysed if r.steady),
-                        key=lambda r: r.date, reverse=True)
+                        key=attrgetter('date'), reverse=True)
         result = DecouplingResult(
             period_start=start_date, period_end=end_date, rides=steady,
             monthly_decoupling=_monthly(steady, "decoupling_pct", start_date, end_date),
@@ -389,7 +390,7 @@ class DecouplingAnalyzer:
                 analysed.append(rd)
 
         reported = sorted((r for r in analysed if r.steady is not False),
-                          key=lambda r: r.date, reverse=True)
+                          key=attrgetter('date'), reverse=True)
         result = PaHrResult(
             period_start=start_date, period_end=end_date, rides=reported,
             monthly_decoupling=_monthly(reported, "decoupling_pct", start_date, end_date),
@@ -25,6 +25,22 @@ class InsightSeverity(Enum):
     ALERT = "alert"
 
 
+# Icon lookups shared by every MetricSummary / Insight instead of being
+# rebuilt on each property access
+_TREND_ICONS = {
+    TrendDirection.IMPROVING: "↑",
+    TrendDirection.DECLINING: "↓",
+    TrendDirection.STABLE: "→",
+}
+
+_SEVERITY_ICONS = {
+    InsightSeverity.INFO: "ℹ️",
+    InsightSeverity.POSITIVE: "✅",
+    InsightSeverity.WARNING: "⚠️",
+    InsightSeverity.ALERT: "🚨",
+}
+
+
 @dataclass
 class MetricSummary:
     """Summary statistics for a single metric."""
@@ -42,12 +58,7 @@ class MetricSummary:
     @property
     def trend_icon(self) -> str:
         """Get icon for trend direction."""
-        icons = {
-            TrendDirection.IMPROVING: "↑",
-            TrendDirection.DECLINING: "↓",
-            TrendDirection.STABLE: "→",
-        }
-        return icons.get(self.trend, "?")
+        return _TREND_ICONS.get(self.trend, "?")
 
 
 @dataclass
@@ -64,13 +75,7 @@ class Insight:
     @property
     def severity_icon(self) -> str:
         """Get icon for severity level."""
-        icons = {
-            InsightSeverity.INFO: "ℹ️",
-            InsightSeverity.POSITIVE: "✅",
-            InsightSeverity.WARNING: "⚠️",
-            InsightSeverity.ALERT: "🚨",
-        }
-        return icons.get(self.severity, "")
+        return _SEVERITY_ICONS.get(self.severity, "")
 
 
 @dataclass
@@ -5,6 +5,7 @@ and identify potential overtraining or injury risk.
 """
 
 from datetime import date, timedelta
+from operator import attrgetter
 from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -479,7 +480,7 @@ class RecoveryAnalyzer:
         if not daily_data:
             return None
 
-        sorted_data = sorted(daily_data, key=lambda d: d.date, reverse=True)
+        sorted_data = sorted(daily_data, key=attrgetter('date'), reverse=True)
         values = []
         for d in sorted_data[:n_days]:
             val = getattr(d, field, None)
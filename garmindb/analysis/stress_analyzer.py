@@ -4,7 +4,11 @@ This module analyzes stress data to identify patterns, calculate cumulative
 stress load (AUC), and measure post-activity recovery efficiency.
 """
 
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from itertools import pairwise
+from operator import attrgetter
 from typing import List, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +23,76 @@ from .models import (
 )
 
 
+# Static insight recommendations, shared across analyze() calls
+_HIGH_LOAD_RECOMMENDATIONS = (
+    "Schedule regular breaks during high-stress hours",
+    "Practice breathing exercises",
+    "Consider reducing commitments if possible",
+)
+
+_POOR_RECOVERY_RECOMMENDATIONS = (
+    "Ensure adequate sleep before activities",
+    "Consider reducing training intensity",
+    "Allow more rest between sessions",
+)
+
+_OCCUPATIONAL_RECOMMENDATIONS = (
+    "Review work-life balance",
+    "Take micro-breaks during work hours",
+)
+
+_WORK_HOURS_PEAK_RECOMMENDATIONS = (
+    "Schedule demanding tasks during lower-stress periods",
+    "Take a walk during peak stress hours",
+)
+
+_SLOW_RECOVERY_RECOMMENDATIONS = (
+    "Prioritize sleep quality",
+    "Consider recovery-focused activities (yoga, meditation)",
+    "Reduce training load temporarily",
+)
+
+_INCOMPLETE_RECOVERY_RECOMMENDATIONS = (
+    "Monitor for signs of overtraining",
+    "Ensure adequate nutrition post-activity",
+    "Consider longer cool-down periods",
+)
+
+
+@dataclass
+class _StressAccumulator:
+    """Raw sums and counts gathered in one pass over period stress records.
+
+    Only valid readings (stress > 0) are accumulated. Per-day lists are
+    indexed by day offset from the period start.
+    """
+
+    num_days: int
+    count: int = 0
+    total: int = 0
+    min_value: Optional[int] = None
+    max_value: Optional[int] = None
+    count_7d: int = 0
+    total_7d: int = 0
+    count_30d: int = 0
+    total_30d: int = 0
+    category_counts: List[int] = field(default_factory=lambda: [0, 0, 0])
+    hour_totals: List[int] = field(default_factory=lambda: [0] * 24)
+    hour_counts: List[int] = field(default_factory=lambda: [0] * 24)
+    hour_category_counts: List[List[int]] = field(
+        default_factory=lambda: [[0, 0, 0] for _ in range(24)]
+    )
+    weekday_totals: List[int] = field(default_factory=lambda: [0] * 7)
+    weekday_counts: List[int] = field(default_factory=lambda: [0] * 7)
+    day_totals: List[int] = field(default_factory=list)
+    day_counts: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Size the per-day buckets to the period length."""
+        self.day_totals = [0] * self.num_days
+        self.day_counts = [0] * self.num_days
+
+
 class StressAnalyzer:
     """Analyzes stress patterns, load, and recovery efficiency.
 
@@ -92,12 +166,16 @@ class StressAnalyzer:
         stress_records = self._repository.get_stress_data(
             lookback_start, end_date
         )
-        activities = self._repository.get_activities(start_date, end_date)
+
+        # Period bounds as datetimes so filters compare timestamps directly
+        # instead of allocating a date per record
+        start_dt = datetime.combine(start_date, time.min)
+        end_dt = datetime.combine(end_date, time.max)
 
         # Filter to analysis period for most calculations
         period_records = [
             r for r in stress_records
-            if start_date <= r.timestamp.date() <= end_date
+            if start_dt <= r.timestamp <= end_dt
         ]
 
         # Calculate personal baseline (uses full lookback period)
@@ -105,48 +183,30 @@ class StressAnalyzer:
             stress_records, end_date
         )
 
-        # Filter valid stress values for distribution/average
-        valid_values = [
-            r.stress_level for r in period_records
-            if r.stress_level is not None and r.stress_level > 0
-        ]
+        # Nothing to aggregate without stress data in the period
+        if not period_records:
+            return self._empty_result(start_date, end_date, personal_baseline)
+
+        activities = self._repository.get_activities(start_date, end_date)
+
+        # Gather sums and counts for all aggregates in one pass
+        acc = self._accumulate(period_records, start_date, end_date)
 
         # Calculate distribution percentages
-        if valid_values:
-            low_count = sum(
-                1 for v in valid_values if v <= self.STRESS_LOW_MAX
-            )
-            med_count = sum(
-                1 for v in valid_values
-                if self.STRESS_LOW_MAX < v <= self.STRESS_MEDIUM_MAX
-            )
-            high_count = sum(
-                1 for v in valid_values if v > self.STRESS_MEDIUM_MAX
-            )
-            total = len(valid_values)
+        if acc.count:
+            low_count, med_count, high_count = acc.category_counts
+            total = acc.count
             low_pct = round(low_count / total * 100, 1)
             med_pct = round(med_count / total * 100, 1)
             high_pct = round(high_count / total * 100, 1)
-            avg_stress = sum(valid_values) / len(valid_values)
+            avg_stress = acc.total / total
         else:
             low_pct = med_pct = high_pct = 0.0
             avg_stress = 0.0
 
         # Calculate 7-day and 30-day averages for trend
-        recent_7d = [
-            r.stress_level for r in period_records
-            if r.stress_level is not None
-            and r.stress_level > 0
-            and r.timestamp.date() > end_date - timedelta(days=7)
-        ]
-        recent_30d = [
-            r.stress_level for r in period_records
-            if r.stress_level is not None
-            and r.stress_level > 0
-            and r.timestamp.date() > end_date - timedelta(days=30)
-        ]
-        avg_7d = sum(recent_7d) / len(recent_7d) if recent_7d else None
-        avg_30d = sum(recent_30d) / len(recent_30d) if recent_30d else None
+        avg_7d = acc.total_7d / acc.count_7d if acc.count_7d else None
+        avg_30d = acc.total_30d / acc.count_30d if acc.count_30d else None
 
         # Determine trend
         trend = TrendDirection.STABLE
@@ -164,29 +224,27 @@ class StressAnalyzer:
             unit="",
             average_7d=round(avg_7d, 1) if avg_7d else None,
             average_30d=round(avg_30d, 1) if avg_30d else None,
-            min_value=min(valid_values) if valid_values else None,
-            max_value=max(valid_values) if valid_values else None,
+            min_value=acc.min_value,
+            max_value=acc.max_value,
             trend=trend,
         )
 
         # Calculate stress load for period
-        start_dt = datetime.combine(start_date, time.min)
-        end_dt = datetime.combine(end_date, time.max)
         stress_load = self._calculate_stress_load(
             period_records, start_dt, end_dt
         )
 
         # Calculate patterns
-        hourly_patterns = self._calculate_hourly_patterns(period_records)
-        weekday_avg = self._calculate_weekday_averages(period_records)
+        hourly_patterns = self._calculate_hourly_patterns(acc)
+        weekday_avg = self._calculate_weekday_averages(acc)
 
         # Find peak and lowest stress times from hourly patterns
         active_patterns = [p for p in hourly_patterns if p.sample_count > 0]
         peak_stress_time = None
         lowest_stress_time = None
         if active_patterns:
-            peak_pattern = max(active_patterns, key=lambda p: p.avg_stress)
-            lowest_pattern = min(active_patterns, key=lambda p: p.avg_stress)
+            peak_pattern = max(active_patterns, key=attrgetter('avg_stress'))
+            lowest_pattern = min(active_patterns, key=attrgetter('avg_stress'))
             peak_stress_time = time(hour=peak_pattern.hour)
             lowest_stress_time = time(hour=lowest_pattern.hour)
 
@@ -210,17 +268,11 @@ class StressAnalyzer:
 
         # Calculate daily averages for charts
         daily_avg: Dict[date, float] = {}
-        for d in range((end_date - start_date).days + 1):
-            current_date = start_date + timedelta(days=d)
-            day_values = [
-                r.stress_level for r in period_records
-                if r.stress_level is not None
-                and r.stress_level > 0
-                and r.timestamp.date() == current_date
-            ]
-            if day_values:
+        for day_idx, count in enumerate(acc.day_counts):
+            if count:
+                current_date = start_date + timedelta(days=day_idx)
                 daily_avg[current_date] = round(
-                    sum(day_values) / len(day_values), 1
+                    acc.day_totals[day_idx] / count, 1
                 )
 
         # Build result
@@ -249,6 +301,54 @@ class StressAnalyzer:
 
         return result
 
+    def _empty_result(
+        self,
+        start_date: date,
+        end_date: date,
+        personal_baseline: float
+    ) -> StressAnalysisResult:
+        """Build the result for a period without stress readings.
+
+        Skips filtering, sorting and the activity lookup entirely; post-activity
+        recovery needs in-period stress data, so no patterns are produced.
+
+        Args:
+            start_date: Start of analysis period (inclusive)
+            end_date: End of analysis period (inclusive)
+            personal_baseline: Baseline from the lookback period
+
+        Returns:
+            Zero-filled StressAnalysisResult
+        """
+        from .models import MetricSummary
+
+        acc = _StressAccumulator(
+            num_days=(end_date - start_date).days + 1
+        )
+        result = StressAnalysisResult(
+            period_start=start_date,
+            period_end=end_date,
+            avg_stress=MetricSummary(
+                name="Average Stress",
+                current_value=0.0,
+                unit="",
+            ),
+            low_stress_percent=0.0,
+            medium_stress_percent=0.0,
+            high_stress_percent=0.0,
+            stress_load=StressLoadMetric(
+                period_minutes=0,
+                total_load=0.0,
+                avg_intensity=0.0,
+                peak_load_hour=None
+            ),
+            hourly_patterns=self._calculate_hourly_patterns(acc),
+            weekday_avg=self._calculate_weekday_averages(acc),
+            personal_baseline=personal_baseline,
+        )
+        result.insights.extend(self._generate_insights(result))
+        return result
+
     def _calculate_stress_load(
         self,
         stress_records: List,
@@ -290,48 +390,45 @@ class StressAnalyzer:
                 peak_load_hour=None
             )
 
-        # Sort by timestamp
-        valid_records.sort(key=lambda r: r.timestamp)
+        # Repository data is already ordered, so this is usually a no-op
+        valid_records = self._sorted_by_timestamp(valid_records)
 
+        gap_cap = self.GAP_CAP_MINUTES
         total_load = 0.0
-        total_weighted_stress = 0.0
         total_minutes = 0.0
-        hourly_load: Dict[int, float] = {}
-
-        for i, record in enumerate(valid_records):
-            # Calculate duration to next record (or use 1 minute for last)
-            if i < len(valid_records) - 1:
-                next_ts = valid_records[i + 1].timestamp
-                duration = (next_ts - record.timestamp).total_seconds() / 60.0
-                # Cap gaps at GAP_CAP_MINUTES
-                duration = min(duration, self.GAP_CAP_MINUTES)
-            else:
-                duration = 1.0  # Last record: assume 1 minute
+        hourly_load = [0.0] * 24
 
-            # Accumulate load
+        # Each reading lasts until the next one, capped at GAP_CAP_MINUTES
+        for record, next_record in pairwise(valid_records):
+            duration = min(
+                (next_record.timestamp - record.timestamp).total_seconds() / 60.0,
+                gap_cap
+            )
             stress_contribution = record.stress_level * duration
             total_load += stress_contribution
-            total_weighted_stress += stress_contribution
             total_minutes += duration
+            hourly_load[record.timestamp.hour] += stress_contribution
 
-            # Track hourly load
-            hour = record.timestamp.hour
-            load = hourly_load.get(hour, 0.0) + stress_contribution
-            hourly_load[hour] = load
+        # Last record: assume 1 minute
+        last = valid_records[-1]
+        stress_contribution = last.stress_level * 1.0
+        total_load += stress_contribution
+        total_minutes += 1.0
+        hourly_load[last.timestamp.hour] += stress_contribution
 
-        # Normalize load to "stress points" (divide by 60)
-        total_load = total_load / 60.0
-
-        # Calculate average intensity
+        # Calculate average intensity (raw load is the weighted stress sum)
         avg_intensity = (
-            total_weighted_stress / total_minutes
+            total_load / total_minutes
             if total_minutes > 0 else 0.0
         )
 
+        # Normalize load to "stress points" (divide by 60)
+        total_load /= 60.0
+
         # Find peak load hour
         peak_hour = None
-        if hourly_load:
-            peak_hour_int = max(hourly_load, key=hourly_load.get)
+        if max(hourly_load) > 0:
+            peak_hour_int = max(range(24), key=hourly_load.__getitem__)
             peak_hour = time(hour=peak_hour_int)
 
         return StressLoadMetric(
@@ -341,6 +438,33 @@ class StressAnalyzer:
             peak_load_hour=peak_hour
         )
 
+    def _total_load(self, records: List) -> float:
+        """Calculate only the total stress load for pre-filtered records.
+
+        Lightweight variant of _calculate_stress_load for callers that
+        already hold valid, time-ordered records within the window and only
+        need the scalar load (no sort, hourly buckets or peak hour).
+
+        Args:
+            records: Valid StressRecord DTOs ordered by timestamp
+
+        Returns:
+            Total stress load in stress points, rounded to 0.1
+        """
+        if not records:
+            return 0.0
+
+        gap_cap = self.GAP_CAP_MINUTES
+        total_load = 0.0
+        for record, next_record in pairwise(records):
+            duration = (
+                next_record.timestamp - record.timestamp
+            ).total_seconds() / 60.0
+            total_load += record.stress_level * min(duration, gap_cap)
+        total_load += records[-1].stress_level  # Last record: 1 minute
+
+        return round(total_load / 60.0, 1)
+
     def _calculate_personal_baseline(
         self,
         stress_records: List,
@@ -358,61 +482,148 @@ class StressAnalyzer:
         Returns:
             Personal baseline stress level (default 25.0 if insufficient data)
         """
-        from datetime import timedelta
+        from datetime import time, timedelta
 
         # Calculate baseline period
         baseline_start = end_date - timedelta(days=self.BASELINE_DAYS)
+        baseline_start_dt = datetime.combine(baseline_start, time.min)
+        baseline_end_dt = datetime.combine(end_date, time.max)
 
-        # Filter to resting hours (00:00-06:00) in baseline period
+        # Filter to resting hours (00:00-06:00) in baseline period. The hour
+        # test goes first: it is the cheapest and rejects most records, so
+        # the datetime comparisons only run for the night-time remainder.
         start_hour, end_hour = self.BASELINE_HOURS
         resting_values = [
             r.stress_level for r in stress_records
-            if r.stress_level is not None
+            if start_hour <= r.timestamp.hour < end_hour
+            and baseline_start_dt <= r.timestamp <= baseline_end_dt
+            and r.stress_level is not None
             and r.stress_level > 0
-            and baseline_start <= r.timestamp.date() <= end_date
-            and start_hour <= r.timestamp.hour < end_hour
         ]
 
         if len(resting_values) < 10:  # Need minimum data
             return 25.0  # Default baseline
 
-        # Calculate 25th percentile
+        # Calculate 25th percentile (nearest-rank on the sorted night-time
+        # values, a few thousand at most, so sorting is not the hot path)
         resting_values.sort()
         idx = int(len(resting_values) * self.BASELINE_PERCENTILE / 100)
         idx = max(0, min(idx, len(resting_values) - 1))
 
         return float(resting_values[idx])
 
+    def _accumulate(
+        self,
+        period_records: List,
+        start_date: date,
+        end_date: date
+    ) -> '_StressAccumulator':
+        """Walk period records once, filling every aggregate's accumulators.
+
+        Distribution, trend averages, hourly/weekday patterns and daily
+        averages all read from the returned sums and counts instead of
+        re-scanning the records. Stress categories are indexed by the
+        number of thresholds a value exceeds (0 = low, 1 = medium,
+        2 = high).
+
+        Args:
+            period_records: StressRecord DTOs within the analysis period
+            start_date: Start of analysis period (inclusive)
+            end_date: End of analysis period (inclusive)
+
+        Returns:
+            _StressAccumulator with raw sums and counts
+        """
+        low_max = self.STRESS_LOW_MAX
+        medium_max = self.STRESS_MEDIUM_MAX
+        start_ord = start_date.toordinal()
+        end_ord = end_date.toordinal()
+        acc = _StressAccumulator(num_days=end_ord - start_ord + 1)
+
+        count = total = 0
+        count_7d = total_7d = count_30d = total_30d = 0
+        min_value = max_value = None
+        hour_totals = acc.hour_totals
+        hour_counts = acc.hour_counts
+        hour_category_counts = acc.hour_category_counts
+        day_totals = acc.day_totals
+        day_counts = acc.day_counts
+
+        for record in period_records:
+            level = record.stress_level
+            if level is None or level <= 0:
+                continue
+            timestamp = record.timestamp
+            day_ord = timestamp.toordinal()
+            hour = timestamp.hour
+
+            count += 1
+            total += level
+            if min_value is None or level < min_value:
+                min_value = level
+            if max_value is None or level > max_value:
+                max_value = level
+
+            days_ago = end_ord - day_ord
+            if days_ago < 30:
+                count_30d += 1
+                total_30d += level
+                if days_ago < 7:
+                    count_7d += 1
+                    total_7d += level
+
+            hour_totals[hour] += level
+            hour_counts[hour] += 1
+            hour_category_counts[hour][
+                (level > low_max) + (level > medium_max)
+            ] += 1
+
+            day_totals[day_ord - start_ord] += level
+            day_counts[day_ord - start_ord] += 1
+
+        acc.count = count
+        acc.total = total
+        acc.min_value = min_value
+        acc.max_value = max_value
+        acc.count_7d = count_7d
+        acc.total_7d = total_7d
+        acc.count_30d = count_30d
+        acc.total_30d = total_30d
+        # Weekday sums are folded from the per-day sums rather than
+        # computing a weekday for every record
+        start_weekday = start_date.weekday()
+        for offset, day_count in enumerate(day_counts):
+            if day_count:
+                weekday = (start_weekday + offset) % 7
+                acc.weekday_totals[weekday] += day_totals[offset]
+                acc.weekday_counts[weekday] += day_count
+        acc.category_counts = [
+            sum(counts[i] for counts in hour_category_counts)
+            for i in range(3)
+        ]
+        return acc
+
     def _calculate_hourly_patterns(
         self,
-        stress_records: List
+        acc: '_StressAccumulator'
     ) -> List[HourlyStressPattern]:
         """Calculate average stress by hour of day.
 
-        Groups stress readings by hour and computes:
+        Uses the per-hour sums and counts gathered by _accumulate to compute:
         - Average stress per hour
         - Sample count
         - Category distribution (low/medium/high percentages)
 
         Args:
-            stress_records: List of StressRecord DTOs
+            acc: Accumulated period aggregates
 
         Returns:
             List of HourlyStressPattern for hours 0-23
         """
-        # Initialize hourly buckets
-        hourly_data: Dict[int, List[int]] = {h: [] for h in range(24)}
-
-        # Group valid records by hour
-        for record in stress_records:
-            if record.stress_level is not None and record.stress_level > 0:
-                hour = record.timestamp.hour
-                hourly_data[hour].append(record.stress_level)
-
         patterns = []
         for hour in range(24):
-            values = hourly_data[hour]
-            if not values:
+            total = acc.hour_counts[hour]
+            if not total:
                 patterns.append(HourlyStressPattern(
                     hour=hour,
                     avg_stress=0.0,
@@ -422,16 +633,10 @@ class StressAnalyzer:
                 continue
 
             # Calculate average
-            avg_stress = sum(values) / len(values)
+            avg_stress = acc.hour_totals[hour] / total
 
             # Calculate category distribution
-            low_count = sum(1 for v in values if v <= self.STRESS_LOW_MAX)
-            med_count = sum(
-                1 for v in values
-                if self.STRESS_LOW_MAX < v <= self.STRESS_MEDIUM_MAX
-            )
-            high_count = sum(1 for v in values if v > self.STRESS_MEDIUM_MAX)
-            total = len(values)
+            low_count, med_count, high_count = acc.hour_category_counts[hour]
 
             category_dist = {
                 "low": round(low_count / total * 100, 1),
@@ -442,7 +647,7 @@ class StressAnalyzer:
             patterns.append(HourlyStressPattern(
                 hour=hour,
                 avg_stress=round(avg_stress, 1),
-                sample_count=len(values),
+                sample_count=total,
                 category_distribution=category_dist
             ))
 
@@ -450,12 +655,12 @@ class StressAnalyzer:
 
     def _calculate_weekday_averages(
         self,
-        stress_records: List
+        acc: '_StressAccumulator'
     ) -> Dict[str, float]:
         """Calculate average stress by day of week.
 
         Args:
-            stress_records: List of StressRecord DTOs
+            acc: Accumulated period aggregates
 
         Returns:
             Dict mapping weekday name to average stress
@@ -464,20 +669,13 @@ class StressAnalyzer:
             "Monday", "Tuesday", "Wednesday", "Thursday",
             "Friday", "Saturday", "Sunday"
         ]
-        weekday_data: Dict[int, List[int]] = {i: [] for i in range(7)}
-
-        # Group valid records by weekday
-        for record in stress_records:
-            if record.stress_level is not None and record.stress_level > 0:
-                weekday = record.timestamp.weekday()
-                weekday_data[weekday].append(record.stress_level)
 
         # Calculate averages
         result = {}
         for i, name in enumerate(weekday_names):
-            values = weekday_data[i]
-            if values:
-                result[name] = round(sum(values) / len(values), 1)
+            count = acc.weekday_counts[i]
+            if count:
+                result[name] = round(acc.weekday_totals[i] / count, 1)
             else:
                 result[name] = 0.0
 
@@ -510,10 +708,17 @@ class StressAnalyzer:
         if not activities or not stress_records:
             return []
 
-        # Sort stress records by timestamp for efficient lookup
-        sorted_stress = sorted(stress_records, key=lambda r: r.timestamp)
+        # Sort stress records by timestamp so each activity's windows can be
+        # located by bisection instead of scanning every record
+        sorted_stress = self._sorted_by_timestamp(stress_records)
+        timestamps = [r.timestamp for r in sorted_stress]
         recovery_target = baseline + self.RECOVERY_THRESHOLD_BUFFER
 
+        # Window offsets are the same for every activity
+        pre_window = timedelta(minutes=30)
+        post_window = timedelta(hours=self.RECOVERY_WINDOW_HOURS)
+        one_minute = timedelta(minutes=1)
+
         patterns = []
         for activity in activities:
             # Calculate activity end time
@@ -527,15 +732,19 @@ class StressAnalyzer:
             end_time = activity.start_time + activity.duration
 
             # Define time windows
-            pre_start = end_time - timedelta(minutes=30)
-            post_end = end_time + timedelta(hours=self.RECOVERY_WINDOW_HOURS)
+            pre_start = end_time - pre_window
+            post_end = end_time + post_window
+
+            # Index bounds of [pre_start, end_time) and [end_time, post_end]
+            pre_idx = bisect_left(timestamps, pre_start)
+            end_idx = bisect_left(timestamps, end_time, pre_idx)
+            post_idx = bisect_right(timestamps, post_end, end_idx)
 
             # Get pre-activity stress (30min before)
             pre_stress_values = [
-                r.stress_level for r in sorted_stress
+                r.stress_level for r in sorted_stress[pre_idx:end_idx]
                 if r.stress_level is not None
                 and r.stress_level > 0
-                and pre_start <= r.timestamp < end_time
             ]
             pre_activity_stress = (
                 sum(pre_stress_values) / len(pre_stress_values)
@@ -544,32 +753,27 @@ class StressAnalyzer:
 
             # Get post-activity stress records
             post_records = [
-                r for r in sorted_stress
+                r for r in sorted_stress[end_idx:post_idx]
                 if r.stress_level is not None
                 and r.stress_level > 0
-                and end_time <= r.timestamp <= post_end
             ]
 
             if not post_records:
                 continue  # No data to analyze
 
-            # Find peak post-activity stress
-            peak_post_stress = max(r.stress_level for r in post_records)
-
             # Calculate stress load in recovery window
-            recovery_load = self._calculate_stress_load(
-                post_records,
-                end_time,
-                post_end
-            )
+            recovery_load = self._total_load(post_records)
 
-            # Find time to recovery (when stress <= baseline + 5)
+            # Find peak post-activity stress and time to recovery (when
+            # stress <= baseline + 5) in the same walk over the window
+            peak_post_stress = 0
             recovery_time = None
             for record in post_records:
-                if record.stress_level <= recovery_target:
-                    delta = record.timestamp - end_time
-                    recovery_time = int(delta.total_seconds() / 60)
-                    break
+                level = record.stress_level
+                if level > peak_post_stress:
+                    peak_post_stress = level
+                if recovery_time is None and level <= recovery_target:
+                    recovery_time = (record.timestamp - end_time) // one_minute
 
             # Get activity info
             activity_id = str(getattr(activity, 'activity_id', 'unknown'))
@@ -583,12 +787,31 @@ class StressAnalyzer:
                 activity_end_time=end_time,
                 pre_activity_stress=round(pre_activity_stress, 1),
                 peak_post_stress=float(peak_post_stress),
-                stress_load_2h=recovery_load.total_load,
+                stress_load_2h=recovery_load,
                 recovery_time_minutes=recovery_time
             ))
 
         return patterns
 
+    def _sorted_by_timestamp(self, records: List) -> List:
+        """Return records ordered by timestamp, skipping the sort if possible.
+
+        Repositories already return stress data ordered by timestamp, so a
+        linear ordering check avoids an O(n log n) sort in the common case.
+
+        Args:
+            records: List of DTOs with a ``timestamp`` attribute
+
+        Returns:
+            The input list if already ordered, else a sorted copy
+        """
+        if all(
+            prev.timestamp <= curr.timestamp
+            for prev, curr in pairwise(records)
+        ):
+            return records
+        return sorted(records, key=attrgetter('timestamp'))
+
     def _calculate_recovery_efficiency(
         self,
         patterns: List[PostActivityStressPattern]
@@ -611,13 +834,13 @@ class StressAnalyzer:
 
         # Calculate average recovery time (None = 120 min worst case)
         max_recovery = self.RECOVERY_WINDOW_HOURS * 60  # 120 minutes
-        recovery_times = [
-            p.recovery_time_minutes if p.recovery_time_minutes is not None
-            else max_recovery
+        total_recovery = sum(
+            max_recovery if p.recovery_time_minutes is None
+            else p.recovery_time_minutes
             for p in patterns
-        ]
+        )
 
-        avg_recovery = sum(recovery_times) / len(recovery_times)
+        avg_recovery = total_recovery / len(patterns)
 
         # Efficiency = 100 - (avg_time / 120) * 100
         efficiency = 100 - (avg_recovery / max_recovery) * 100
@@ -662,11 +885,7 @@ class StressAnalyzer:
                     severity=InsightSeverity.WARNING,
                     category="stress",
                     data_points={"daily_avg_load": daily_avg_load},
-                    recommendations=[
-                        "Schedule regular breaks during high-stress hours",
-                        "Practice breathing exercises",
-                        "Consider reducing commitments if possible"
-                    ]
+                    recommendations=list(_HIGH_LOAD_RECOMMENDATIONS)
                 ))
 
         # Recovery Efficiency insights
@@ -679,11 +898,7 @@ class StressAnalyzer:
                     severity=InsightSeverity.WARNING,
                     category="stress",
                     data_points={"efficiency": eff},
-                    recommendations=[
-                        "Ensure adequate sleep before activities",
-                        "Consider reducing training intensity",
-                        "Allow more rest between sessions"
-                    ]
+                    recommendations=list(_POOR_RECOVERY_RECOMMENDATIONS)
                 ))
             elif eff >= 80:
                 insights.append(Insight(
@@ -701,13 +916,12 @@ class StressAnalyzer:
                 "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"
             ]
             weekend_names = ["Saturday", "Sunday"]
+            weekday_avg = result.weekday_avg
             workday_vals = [
-                result.weekday_avg.get(d, 0) for d in workday_names
-                if result.weekday_avg.get(d, 0) > 0
+                v for d in workday_names if (v := weekday_avg.get(d, 0)) > 0
             ]
             weekend_vals = [
-                result.weekday_avg.get(d, 0) for d in weekend_names
-                if result.weekday_avg.get(d, 0) > 0
+                v for d in weekend_names if (v := weekday_avg.get(d, 0)) > 0
             ]
             if workday_vals and weekend_vals:
                 workday_avg = sum(workday_vals) / len(workday_vals)
@@ -726,10 +940,7 @@ class StressAnalyzer:
                             "workday_avg": workday_avg,
                             "weekend_avg": weekend_avg
                         },
-                        recommendations=[
-                            "Review work-life balance",
-                            "Take micro-breaks during work hours"
-                        ]
+                        recommendations=list(_OCCUPATIONAL_RECOMMENDATIONS)
                     ))
 
         # Work Hours Stress Peak
@@ -743,10 +954,7 @@ class StressAnalyzer:
                     severity=InsightSeverity.INFO,
                     category="stress",
                     data_points={"peak_hour": peak_hour},
-                    recommendations=[
-                        "Schedule demanding tasks during lower-stress periods",
-                        "Take a walk during peak stress hours"
-                    ]
+                    recommendations=list(_WORK_HOURS_PEAK_RECOMMENDATIONS)
                 ))
 
         # Slow Autonomic Recovery
@@ -758,11 +966,7 @@ class StressAnalyzer:
                 severity=InsightSeverity.WARNING,
                 category="stress",
                 data_points={"avg_recovery_min": avg_rec},
-                recommendations=[
-                    "Prioritize sleep quality",
-                    "Consider recovery-focused activities (yoga, meditation)",
-                    "Reduce training load temporarily"
-                ]
+                recommendations=list(_SLOW_RECOVERY_RECOMMENDATIONS)
             ))
 
         # Incomplete Recovery After Activity
@@ -782,11 +986,7 @@ class StressAnalyzer:
                     "count": len(incomplete),
                     "sports": sports
                 },
-                recommendations=[
-                    "Monitor for signs of overtraining",
-                    "Ensure adequate nutrition post-activity",
-                    "Consider longer cool-down periods"
-                ]
+                recommendations=list(_INCOMPLETE_RECOVERY_RECOMMENDATIONS)
             ))
 
         return insights
@@ -2,14 +2,21 @@
 
 These dataclasses provide a clean interface between the data layer
 and the analysis layer, decoupling from SQLAlchemy models.
+
+All records are immutable and use ``__slots__``: repositories can return
+hundreds of thousands of them per call, so dropping the per-instance
+``__dict__`` keeps memory and attribute access cheap.
 """
 
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, fields
 from datetime import date, datetime, time, timedelta
-from typing import Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SleepRecord:
     """Sleep data for a single night."""
 
@@ -31,23 +38,21 @@ class SleepRecord:
     @property
     def deep_sleep_percent(self) -> float:
         """Deep sleep as percentage of total."""
-        if self.total_sleep.total_seconds() == 0:
-            return 0.0
-        deep_secs = self.deep_sleep.total_seconds()
         total_secs = self.total_sleep.total_seconds()
-        return (deep_secs / total_secs) * 100
+        if not total_secs:
+            return 0.0
+        return (self.deep_sleep.total_seconds() / total_secs) * 100
 
     @property
     def rem_sleep_percent(self) -> float:
         """REM sleep as percentage of total."""
-        if self.total_sleep.total_seconds() == 0:
-            return 0.0
-        rem_secs = self.rem_sleep.total_seconds()
         total_secs = self.total_sleep.total_seconds()
-        return (rem_secs / total_secs) * 100
+        if not total_secs:
+            return 0.0
+        return (self.rem_sleep.total_seconds() / total_secs) * 100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeartRateRecord:
     """Heart rate measurement."""
 
@@ -56,7 +61,44 @@ class HeartRateRecord:
     resting_hr: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class HeartRateSeries:
+    """Heart rate samples for a period as parallel columns.
+
+    Column-oriented counterpart of a list of ``HeartRateRecord`` for
+    aggregate scans: ``heart_rates`` is a compact ``array('H')`` that can
+    be fed straight to ``statistics``, ``sum``/``max`` or ``memoryview``
+    without touching a Python object per sample.
+    """
+
+    timestamps: Tuple[datetime, ...]
+    heart_rates: array
+    resting: bool = False
+
+    def __len__(self) -> int:
+        """Number of samples in the series."""
+        return len(self.heart_rates)
+
+    def zone_counts(self, zone_edges: Sequence[int]) -> List[int]:
+        """Count samples falling in each heart rate zone.
+
+        Samples are tallied per distinct bpm value in C (``Counter``) and
+        only the few hundred distinct values are bucketed in Python.
+
+        Args:
+            zone_edges: Ascending lower bounds (bpm) of zones 2..N. Samples
+                below the first edge fall in zone 1.
+
+        Returns:
+            ``len(zone_edges) + 1`` sample counts, lowest zone first.
+        """
+        counts = [0] * (len(zone_edges) + 1)
+        for heart_rate, count in Counter(self.heart_rates).items():
+            counts[bisect_right(zone_edges, heart_rate)] += count
+        return counts
+
+
+@dataclass(slots=True, frozen=True)
 class StressRecord:
     """Stress level measurement."""
 
@@ -76,7 +118,7 @@ class StressRecord:
             return "very_high"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BodyBatteryRecord:
     """Body battery measurement."""
 
@@ -86,7 +128,7 @@ class BodyBatteryRecord:
     drained: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActivityRecord:
     """Single activity record."""
 
@@ -112,7 +154,7 @@ class ActivityRecord:
         return timedelta(seconds=seconds_per_km)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DailySummaryRecord:
     """Daily aggregated health summary."""
 
@@ -129,3 +171,34 @@ class DailySummaryRecord:
     calories_total: Optional[int] = None
     sleep_avg: Optional[timedelta] = None
     intensity_mins: Optional[int] = None
+
+
+def _positional_factory(cls) -> Callable:
+    """Generate a positional constructor that fills ``cls`` slots directly.
+
+    Frozen dataclass ``__init__`` routes every field through
+    ``object.__setattr__``; the generated function instead calls each
+    slot descriptor's ``__set__``. Every init field must be passed, in
+    declaration order.
+
+    Args:
+        cls: Slotted dataclass to build instances of.
+
+    Returns:
+        Function taking the init fields positionally and returning ``cls``.
+    """
+    names = [f.name for f in fields(cls) if f.init]
+    namespace = {'_new': object.__new__, '_cls': cls}
+    lines = [f"def make_{cls.__name__}({', '.join(names)}):", "    obj = _new(_cls)"]
+    for name in names:
+        namespace[f'_set_{name}'] = getattr(cls, name).__set__
+        lines.append(f"    _set_{name}(obj, {name})")
+    lines.append("    return obj")
+    exec("\n".join(lines), namespace)
+    return namespace[f'make_{cls.__name__}']
+
+
+# Fast constructors for the per-row repository paths
+make_sleep_record = _positional_factory(SleepRecord)
+make_heart_rate_record = _positional_factory(HeartRateRecord)
+make_stress_record = _positional_factory(StressRecord)
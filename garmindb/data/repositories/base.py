@@ -6,7 +6,7 @@ specific data storage implementations (SQLite, API, etc.).
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional, TYPE_CHECKING
+from typing import Iterator, List, Optional, TYPE_CHECKING
 
 # Use TYPE_CHECKING to avoid import issues when running tests in isolation
 # while still having proper type hints available for IDEs and type checkers
@@ -64,6 +64,29 @@ class HealthRepository(ABC):
         """
         pass
 
+    def iter_heart_rate_data(
+        self,
+        start_date: date,
+        end_date: date,
+        resting_only: bool = False,
+    ) -> Iterator["HeartRateRecord"]:
+        """Yield heart rate records for date range one at a time.
+
+        Lets consumers aggregate long monitoring ranges without holding
+        every record in memory. The default falls back to
+        get_heart_rate_data(); implementations should override it to
+        stream from their data source.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+            resting_only: If True, only yield resting HR values
+
+        Yields:
+            HeartRateRecord DTOs ordered by timestamp
+        """
+        yield from self.get_heart_rate_data(start_date, end_date, resting_only)
+
     @abstractmethod
     def get_stress_data(
         self,
@@ -81,6 +104,26 @@ class HealthRepository(ABC):
         """
         pass
 
+    def iter_stress_data(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> Iterator["StressRecord"]:
+        """Yield stress records for date range one at a time.
+
+        For single-pass consumers of long ranges. The default falls back to
+        get_stress_data(); implementations should override it to stream
+        from their data source.
+
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+
+        Yields:
+            StressRecord DTOs ordered by timestamp
+        """
+        yield from self.get_stress_data(start_date, end_date)
+
     @abstractmethod
     def get_body_battery_data(
         self,
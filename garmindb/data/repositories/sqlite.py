@@ -10,26 +10,107 @@ __author__ = "Tom Goetz"
 __copyright__ = "Copyright Tom Goetz"
 __license__ = "GPL"
 
+import functools
 import logging
+from array import array
 from datetime import date, datetime, timedelta, time as dt_time
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event, func, select
+
+from garmindb.garmindb import (
+    GarminDb, ActivitiesDb, MonitoringDb, Sleep, RestingHeartRate, MonitoringHeartRate,
+    Stress, DailySummary, Activities, Weight
+)
+from garmindb.summarydb import SummaryDb, DaysSummary
 
 from .base import HealthRepository
 from ..models import (
     SleepRecord,
     HeartRateRecord,
+    HeartRateSeries,
     StressRecord,
     BodyBatteryRecord,
     ActivityRecord,
     DailySummaryRecord,
+    make_sleep_record,
+    make_heart_rate_record,
+    make_stress_record,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bound used to turn dates into datetimes for period queries
+_MIDNIGHT = dt_time.min
+_ONE_DAY = timedelta(days=1)
+
+# Per-connection read tuning for SQLite: 256 MiB memory map, 64 MiB page
+# cache (negative values are KiB) and in-memory temp tables for sorts.
+_SQLITE_READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Most recent getter results kept per repository instance
+_QUERY_CACHE_SIZE = 32
+
+
+def _cached_query(method):
+    """Memoize a date range getter per repository instance.
+
+    Several analyzers request the same range during one report, so results
+    are kept as immutable tuples of (frozen) DTOs keyed by method name and
+    arguments. The least recently used range is evicted first. Each call
+    still gets its own list.
+
+    Only for getters returning a row per day or per activity: per-sample
+    monitoring and stress ranges would keep large lists alive, so those
+    getters query every time (or stream, see iter_heart_rate_data()).
+    """
+    @functools.wraps(method)
+    def wrapper(self, start_date, end_date, *args, **kwargs):
+        key = (method.__name__, start_date, end_date, args, tuple(sorted(kwargs.items())))
+        records = self._cache.pop(key, None)
+        if records is None:
+            if len(self._cache) >= _QUERY_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            records = tuple(method(self, start_date, end_date, *args, **kwargs))
+        # (Re)inserting keeps the dict ordered from least to most recently used
+        self._cache[key] = records
+        return list(records)
+    return wrapper
+
+
+def _set_read_pragmas(dbapi_connection, connection_record):
+    """Apply the read tuning pragmas to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_READ_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _tune_for_reads(db):
+    """Register read tuning on a freshly opened SQLite database.
+
+    Connections pooled while the database was being set up predate the
+    listener, so they are dropped and reopened with the pragmas applied.
+    Other backends are left untouched.
+
+    Args:
+        db: idbutils database instance.
+
+    Returns:
+        The same database instance.
+    """
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, "connect", _set_read_pragmas)
+        db.engine.dispose()
+    return db
+
 
 def _import_weight_model():
     """Import the GarminDB Weight model (indirection for testability)."""
-    from garmindb.garmindb import Weight
     return Weight
 
 
@@ -58,6 +139,7 @@ class SQLiteHealthRepository(HealthRepository):
         self._activities_db = None
         self._monitoring_db = None
         self._summary_db = None
+        self._cache = {}
 
     @property
     def garmin_db(self):
@@ -67,8 +149,7 @@ class SQLiteHealthRepository(HealthRepository):
             GarminDb instance for accessing core health data.
         """
         if self._garmin_db is None:
-            from garmindb.garmindb import GarminDb
-            self._garmin_db = GarminDb(self.db_params)
+            self._garmin_db = _tune_for_reads(GarminDb(self.db_params))
         return self._garmin_db
 
     @property
@@ -79,8 +160,7 @@ class SQLiteHealthRepository(HealthRepository):
             ActivitiesDb instance for accessing activity data.
         """
         if self._activities_db is None:
-            from garmindb.garmindb import ActivitiesDb
-            self._activities_db = ActivitiesDb(self.db_params)
+            self._activities_db = _tune_for_reads(ActivitiesDb(self.db_params))
         return self._activities_db
 
     @property
@@ -91,8 +171,7 @@ class SQLiteHealthRepository(HealthRepository):
             MonitoringDb instance for accessing monitoring data.
         """
         if self._monitoring_db is None:
-            from garmindb.garmindb import MonitoringDb
-            self._monitoring_db = MonitoringDb(self.db_params)
+            self._monitoring_db = _tune_for_reads(MonitoringDb(self.db_params))
         return self._monitoring_db
 
     @property
@@ -103,10 +182,25 @@ class SQLiteHealthRepository(HealthRepository):
             SummaryDb instance for accessing summary data.
         """
         if self._summary_db is None:
-            from garmindb.summarydb import SummaryDb
-            self._summary_db = SummaryDb(self.db_params, False)
+            self._summary_db = _tune_for_reads(SummaryDb(self.db_params, False))
         return self._summary_db
 
+    def close(self):
+        """Close the databases this repository opened.
+
+        Pooled connections are released so the database files can be moved
+        or deleted. The databases are reopened on next use.
+        """
+        for attr in ('_garmin_db', '_activities_db', '_monitoring_db', '_summary_db'):
+            db = getattr(self, attr)
+            if db is not None:
+                db.engine.dispose()
+                setattr(self, attr, None)
+
+    def clear_cache(self):
+        """Drop memoized query results, e.g. after the databases were updated."""
+        self._cache.clear()
+
     def _to_datetime(self, d: date) -> datetime:
         """Convert date to datetime for queries.
 
@@ -116,18 +210,22 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             Datetime at start of the given date (00:00:00)
         """
-        return datetime.combine(d, datetime.min.time())
+        return datetime.combine(d, _MIDNIGHT)
 
     def _to_datetime_end(self, d: date) -> datetime:
-        """Convert date to end-of-day datetime for queries.
+        """Convert date to the exclusive upper bound of a period query.
+
+        Periods are queried as ``time_col >= start AND time_col < end`` on
+        the raw column, so the bound is the following midnight rather than
+        23:59:59.999999; no row of the last day can fall past it.
 
         Args:
-            d: Date to convert
+            d: Last date of the period (inclusive)
 
         Returns:
-            Datetime at end of the given date (23:59:59.999999)
+            Datetime at the start of the day after ``d``
         """
-        return datetime.combine(d, datetime.max.time())
+        return datetime.combine(d + _ONE_DAY, _MIDNIGHT)
 
     def _to_date(self, value):
         """Normalize a DB ``day`` value to a plain ``date``.
@@ -158,10 +256,64 @@ class SQLiteHealthRepository(HealthRepository):
         """
         if t is None:
             return timedelta(0)
-        return timedelta(
-            hours=t.hour, minutes=t.minute, seconds=t.second
+        return timedelta(seconds=self._time_to_seconds(t))
+
+    @staticmethod
+    def _time_to_seconds(t: dt_time) -> int:
+        """Convert a time-of-day duration to whole seconds.
+
+        Args:
+            t: Time object holding a duration (hours/minutes/seconds)
+
+        Returns:
+            Duration in seconds
+        """
+        return t.hour * 3600 + t.minute * 60 + t.second
+
+    def _select_columns(self, db, model, columns, start_ts, end_ts, not_none_col=None, where=None):
+        """Select only the named columns for a period in a single query.
+
+        Rows come back as lightweight tuples (not ORM instances) already
+        ordered by the table's time column, so callers need neither
+        per-row attribute fallbacks nor a Python-side sort.
+
+        Args:
+            db: Database instance owning ``model``. Must be opened before
+                ``model.time_col`` is read, as the table is set up on open.
+            model: GarminDB model class to query.
+            columns: Names of the columns to return.
+            start_ts: Start of the period (inclusive).
+            end_ts: End of the period (exclusive).
+            not_none_col: Optional column name that must not be NULL.
+            where: Optional extra filter expression for the same query.
+
+        Returns:
+            List of rows supporting attribute access by column name.
+        """
+        stmt = self._period_select(model, columns, start_ts, end_ts, not_none_col)
+        if where is not None:
+            stmt = stmt.where(where)
+        with db.managed_session() as session:
+            return session.execute(stmt).all()
+
+    def _period_select(self, model, columns, start_ts, end_ts, not_none_col=None):
+        """Build the ordered column select used by _select_columns().
+
+        The model's database must already be open (see _select_columns()).
+
+        Returns:
+            SQLAlchemy Select statement.
+        """
+        stmt = (
+            select(*[getattr(model, col) for col in columns])
+            .where(model.during(start_ts, end_ts))
+            .order_by(model.time_col)
         )
+        if not_none_col is not None:
+            stmt = stmt.where(getattr(model, not_none_col).is_not(None))
+        return stmt
 
+    @_cached_query
     def get_sleep_data(
         self, start_date: date, end_date: date
     ) -> List[SleepRecord]:
@@ -174,31 +326,24 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of SleepRecord DTOs ordered by date
         """
-        from garmindb.garmindb import Sleep
-
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
 
-        raw_data = Sleep.get_for_period(self.garmin_db, start_ts, end_ts)
-
-        records = []
-        for row in raw_data:
-            try:
-                record = SleepRecord(
-                    date=self._to_date(row.day),
-                    total_sleep=self._time_to_timedelta(row.total_sleep),
-                    deep_sleep=self._time_to_timedelta(row.deep_sleep),
-                    light_sleep=self._time_to_timedelta(row.light_sleep),
-                    rem_sleep=self._time_to_timedelta(row.rem_sleep),
-                    awake_time=self._time_to_timedelta(row.awake),
-                    sleep_score=getattr(row, 'score', None),
-                )
-                records.append(record)
-            except Exception:
-                # Skip malformed rows to ensure we return valid data
-                continue
+        rows = self._select_columns(
+            self.garmin_db, Sleep,
+            ('day', 'total_sleep', 'deep_sleep', 'light_sleep', 'rem_sleep', 'awake', 'score'),
+            start_ts, end_ts
+        )
 
-        return sorted(records, key=lambda r: r.date)
+        to_timedelta = self._time_to_timedelta
+        return [
+            make_sleep_record(
+                self._to_date(day), to_timedelta(total_sleep), to_timedelta(deep_sleep),
+                to_timedelta(light_sleep), to_timedelta(rem_sleep), to_timedelta(awake),
+                score, None, None
+            )
+            for day, total_sleep, deep_sleep, light_sleep, rem_sleep, awake, score in rows
+        ]
 
     def get_heart_rate_data(
         self,
@@ -217,56 +362,115 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of HeartRateRecord DTOs ordered by timestamp
         """
+        start_ts = self._to_datetime(start_date)
+        end_ts = self._to_datetime_end(end_date)
+
         if resting_only:
-            from garmindb.garmindb import RestingHeartRate
+            rows = self._select_columns(
+                self.garmin_db, RestingHeartRate, ('day', 'resting_heart_rate'),
+                start_ts, end_ts, not_none_col='resting_heart_rate'
+            )
 
-            start_ts = self._to_datetime(start_date)
-            end_ts = self._to_datetime_end(end_date)
+            # Zero readings mean "no data" in GarminDB
+            records = [
+                HeartRateRecord(
+                    timestamp=datetime.combine(day, _MIDNIGHT),
+                    heart_rate=int(rhr),
+                    resting_hr=int(rhr),
+                )
+                for day, rhr in rows if rhr
+            ]
+            skipped = len(rows) - len(records)
+            if skipped:
+                logger.debug("Skipped %d resting heart rate rows without a reading", skipped)
+            return records
+
+        rows = self._select_columns(
+            self.monitoring_db, MonitoringHeartRate, ('timestamp', 'heart_rate'),
+            start_ts, end_ts
+        )
+        return [
+            make_heart_rate_record(timestamp, heart_rate, None)
+            for timestamp, heart_rate in rows
+        ]
 
-            raw_data = RestingHeartRate.get_for_period(
-                self.garmin_db, start_ts, end_ts
-            )
+    def iter_heart_rate_data(
+        self,
+        start_date: date,
+        end_date: date,
+        resting_only: bool = False,
+        batch_size: int = 1000
+    ) -> Iterator[HeartRateRecord]:
+        """Stream heart rate records without materializing the full range.
 
-            records = []
-            for row in raw_data:
-                try:
-                    rhr = row.resting_heart_rate
-                    rhr = int(rhr) if rhr else None
-                    if rhr is not None:
-                        ts = datetime.combine(row.day, datetime.min.time())
-                        record = HeartRateRecord(
-                            timestamp=ts,
-                            heart_rate=rhr,
-                            resting_hr=rhr,
-                        )
-                        records.append(record)
-                except Exception:
-                    continue
-
-            return sorted(records, key=lambda r: r.timestamp)
-        else:
-            from garmindb.garmindb import MonitoringHeartRate
+        Monitoring rows are fetched from the cursor ``batch_size`` at a time,
+        so peak memory stays bounded for long ranges. Resting values (one
+        per day) are served from get_heart_rate_data().
 
-            start_ts = self._to_datetime(start_date)
-            end_ts = self._to_datetime_end(end_date)
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+            resting_only: If True, only yield daily resting HR values.
+            batch_size: Number of rows fetched from the database per batch
 
-            raw_data = MonitoringHeartRate.get_for_period(
-                self.monitoring_db, start_ts, end_ts
-            )
+        Yields:
+            HeartRateRecord DTOs ordered by timestamp
+        """
+        if resting_only:
+            yield from self.get_heart_rate_data(start_date, end_date, resting_only=True)
+            return
+
+        db = self.monitoring_db
+        stmt = self._period_select(
+            MonitoringHeartRate, ('timestamp', 'heart_rate'),
+            self._to_datetime(start_date), self._to_datetime_end(end_date)
+        ).execution_options(yield_per=batch_size)
+        with db.managed_session() as session:
+            for timestamp, heart_rate in session.execute(stmt):
+                yield make_heart_rate_record(timestamp, heart_rate, None)
+
+    def get_heart_rate_arrays(
+        self,
+        start_date: date,
+        end_date: date,
+        resting_only: bool = False
+    ) -> HeartRateSeries:
+        """Get heart rate samples as parallel columns instead of records.
+
+        Same data as get_heart_rate_data(), for callers that only aggregate
+        over the values and don't need a DTO per sample.
 
-            records = []
-            for row in raw_data:
-                try:
-                    record = HeartRateRecord(
-                        timestamp=row.timestamp,
-                        heart_rate=row.heart_rate,
-                        resting_hr=None,
-                    )
-                    records.append(record)
-                except Exception:
-                    continue
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+            resting_only: If True, only return daily resting HR values.
+                If False, return all monitoring HR data.
+
+        Returns:
+            HeartRateSeries ordered by timestamp
+        """
+        start_ts = self._to_datetime(start_date)
+        end_ts = self._to_datetime_end(end_date)
+
+        if resting_only:
+            rows = self._select_columns(
+                self.garmin_db, RestingHeartRate, ('day', 'resting_heart_rate'),
+                start_ts, end_ts, not_none_col='resting_heart_rate'
+            )
+            # Zero readings mean "no data" in GarminDB
+            rows = [(datetime.combine(day, _MIDNIGHT), int(rhr)) for day, rhr in rows if rhr]
+        else:
+            rows = self._select_columns(
+                self.monitoring_db, MonitoringHeartRate, ('timestamp', 'heart_rate'),
+                start_ts, end_ts
+            )
 
-            return sorted(records, key=lambda r: r.timestamp)
+        timestamps, heart_rates = zip(*rows) if rows else ((), ())
+        return HeartRateSeries(
+            timestamps=timestamps,
+            heart_rates=array('H', heart_rates),
+            resting=resting_only,
+        )
 
     def get_stress_data(
         self, start_date: date, end_date: date
@@ -280,34 +484,57 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of StressRecord DTOs ordered by timestamp
         """
-        from garmindb.garmindb import Stress
-
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
 
-        raw_data = Stress.get_for_period(self.garmin_db, start_ts, end_ts)
+        rows = self._select_columns(
+            self.garmin_db, Stress, ('timestamp', 'stress'),
+            start_ts, end_ts, not_none_col='stress'
+        )
+        return [
+            make_stress_record(timestamp, stress)
+            for timestamp, stress in rows
+        ]
 
-        records = []
-        for row in raw_data:
-            try:
-                if row.stress is not None:
-                    record = StressRecord(
-                        timestamp=row.timestamp,
-                        stress_level=row.stress,
-                    )
-                    records.append(record)
-            except Exception:
-                continue
+    def iter_stress_data(
+        self,
+        start_date: date,
+        end_date: date,
+        batch_size: int = 1000
+    ) -> Iterator[StressRecord]:
+        """Stream stress records without materializing the full range.
+
+        Rows are fetched from the cursor ``batch_size`` at a time, so peak
+        memory stays bounded for long ranges.
 
-        return sorted(records, key=lambda r: r.timestamp)
+        Args:
+            start_date: Start of date range (inclusive)
+            end_date: End of date range (inclusive)
+            batch_size: Number of rows fetched from the database per batch
 
+        Yields:
+            StressRecord DTOs ordered by timestamp
+        """
+        db = self.garmin_db
+        stmt = self._period_select(
+            Stress, ('timestamp', 'stress'),
+            self._to_datetime(start_date), self._to_datetime_end(end_date),
+            not_none_col='stress'
+        ).execution_options(yield_per=batch_size)
+        with db.managed_session() as session:
+            for timestamp, stress in session.execute(stmt):
+                yield make_stress_record(timestamp, stress)
+
+    @_cached_query
     def get_body_battery_data(
         self, start_date: date, end_date: date
     ) -> List[BodyBatteryRecord]:
         """Get body battery records.
 
         Note: Body battery data is stored in the DailySummary table, not
-        in the Stress table. This method queries daily summary data.
+        in the Stress table. This method queries daily summary data from
+        GarminDb; get_daily_summaries() reads the separate DaysSummary
+        table in SummaryDb, so the two cannot share a query.
 
         Args:
             start_date: Start of date range (inclusive)
@@ -316,33 +543,24 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of BodyBatteryRecord DTOs ordered by timestamp
         """
-        from garmindb.garmindb import DailySummary
-
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
 
-        raw_data = DailySummary.get_for_period(
-            self.garmin_db, start_ts, end_ts
+        rows = self._select_columns(
+            self.garmin_db, DailySummary, ('day', 'bb_max', 'bb_charged'),
+            start_ts, end_ts, not_none_col='bb_max'
         )
+        return [
+            BodyBatteryRecord(
+                timestamp=datetime.combine(day, _MIDNIGHT),
+                level=bb_max,
+                charged=bb_charged,
+                drained=None,
+            )
+            for day, bb_max, bb_charged in rows
+        ]
 
-        records = []
-        for row in raw_data:
-            try:
-                bb_max = getattr(row, 'bb_max', None)
-                if bb_max is not None:
-                    ts = datetime.combine(row.day, datetime.min.time())
-                    record = BodyBatteryRecord(
-                        timestamp=ts,
-                        level=bb_max,
-                        charged=getattr(row, 'bb_charged', None),
-                        drained=None,
-                    )
-                    records.append(record)
-            except Exception:
-                continue
-
-        return sorted(records, key=lambda r: r.timestamp)
-
+    @_cached_query
     def get_activities(
         self,
         start_date: date,
@@ -359,52 +577,44 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of ActivityRecord DTOs ordered by start_time
         """
-        from garmindb.garmindb import Activities
-
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
 
-        raw_data = Activities.get_for_period(
-            self.activities_db, start_ts, end_ts
+        # The sport filter runs in the same query, so non-matching rows are
+        # never fetched or converted
+        sport_filter = None
+        if sport:
+            sport_filter = func.lower(Activities.sport).contains(sport.lower(), autoescape=True)
+
+        rows = self._select_columns(
+            self.activities_db, Activities,
+            ('activity_id', 'name', 'sport', 'start_time', 'elapsed_time', 'moving_time',
+             'distance', 'calories', 'avg_hr', 'max_hr', 'training_effect',
+             'anaerobic_training_effect', 'training_load'),
+            start_ts, end_ts, where=sport_filter
         )
 
-        records = []
-        for row in raw_data:
-            try:
-                row_sport = str(row.sport) if row.sport else ""
-
-                # Apply sport filter if specified
-                if sport and sport.lower() not in row_sport.lower():
-                    continue
-
-                # Calculate duration from elapsed_time or moving_time
-                if row.elapsed_time:
-                    duration = self._time_to_timedelta(row.elapsed_time)
-                elif row.moving_time:
-                    duration = self._time_to_timedelta(row.moving_time)
-                else:
-                    duration = timedelta(0)
-
-                record = ActivityRecord(
-                    activity_id=str(row.activity_id),
-                    name=row.name,
-                    sport=row_sport,
-                    start_time=row.start_time,
-                    duration=duration,
-                    distance=row.distance,
-                    calories=row.calories,
-                    avg_hr=row.avg_hr,
-                    max_hr=row.max_hr,
-                    training_effect=row.training_effect,
-                    anaerobic_effect=row.anaerobic_training_effect,
-                    training_load=getattr(row, 'training_load', None),
-                )
-                records.append(record)
-            except Exception:
-                continue
-
-        return sorted(records, key=lambda r: r.start_time)
+        to_timedelta = self._time_to_timedelta
+        return [
+            ActivityRecord(
+                activity_id=str(row.activity_id),
+                name=row.name,
+                sport=str(row.sport) if row.sport else "",
+                start_time=row.start_time,
+                # Prefer elapsed_time, fall back to moving_time
+                duration=to_timedelta(row.elapsed_time or row.moving_time),
+                distance=row.distance,
+                calories=row.calories,
+                avg_hr=row.avg_hr,
+                max_hr=row.max_hr,
+                training_effect=row.training_effect,
+                anaerobic_effect=row.anaerobic_training_effect,
+                training_load=row.training_load,
+            )
+            for row in rows
+        ]
 
+    @_cached_query
     def get_daily_summaries(
         self, start_date: date, end_date: date
     ) -> List[DailySummaryRecord]:
@@ -417,57 +627,38 @@ class SQLiteHealthRepository(HealthRepository):
         Returns:
             List of DailySummaryRecord DTOs ordered by date
         """
-        from garmindb.summarydb import DaysSummary
-
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
 
-        raw_data = DaysSummary.get_for_period(
-            self.summary_db, start_ts, end_ts, DaysSummary
+        rows = self._select_columns(
+            self.summary_db, DaysSummary,
+            ('day', 'rhr_avg', 'stress_avg', 'bb_max', 'bb_min', 'bb_charged', 'steps',
+             'floors', 'activities_distance', 'calories_active_avg', 'calories_avg',
+             'sleep_avg', 'intensity_time'),
+            start_ts, end_ts
         )
 
-        records = []
-        for row in raw_data:
-            try:
-                # Convert sleep_avg from time to timedelta
-                sleep_avg = None
-                if hasattr(row, 'sleep_avg') and row.sleep_avg:
-                    sleep_avg = self._time_to_timedelta(row.sleep_avg)
-
-                # Convert intensity_time from time to minutes (int)
-                intensity_mins = None
-                if hasattr(row, 'intensity_time') and row.intensity_time:
-                    intensity_td = self._time_to_timedelta(row.intensity_time)
-                    intensity_mins = int(intensity_td.total_seconds() / 60)
-
-                # Extract resting HR
-                rhr_avg = getattr(row, 'rhr_avg', None)
-                resting_hr = int(rhr_avg) if rhr_avg else None
-
-                # Extract floors
-                floors_val = getattr(row, 'floors', None)
-                floors = int(floors_val) if floors_val else None
-
-                record = DailySummaryRecord(
-                    date=self._to_date(row.day),
-                    resting_hr=resting_hr,
-                    stress_avg=getattr(row, 'stress_avg', None),
-                    bb_max=getattr(row, 'bb_max', None),
-                    bb_min=getattr(row, 'bb_min', None),
-                    bb_charged=getattr(row, 'bb_charged', None),
-                    steps=getattr(row, 'steps', None),
-                    floors=floors,
-                    distance=getattr(row, 'activities_distance', None),
-                    calories_active=getattr(row, 'calories_active_avg', None),
-                    calories_total=getattr(row, 'calories_avg', None),
-                    sleep_avg=sleep_avg,
-                    intensity_mins=intensity_mins,
-                )
-                records.append(record)
-            except Exception:
-                continue
-
-        return sorted(records, key=lambda r: r.date)
+        to_timedelta = self._time_to_timedelta
+        to_seconds = self._time_to_seconds
+        return [
+            DailySummaryRecord(
+                date=self._to_date(row.day),
+                # 0 bpm is GarminDB's "no reading" marker, not a real average
+                resting_hr=int(row.rhr_avg) if row.rhr_avg else None,
+                stress_avg=row.stress_avg,
+                bb_max=row.bb_max,
+                bb_min=row.bb_min,
+                bb_charged=row.bb_charged,
+                steps=row.steps,
+                floors=None if row.floors is None else int(row.floors),
+                distance=row.activities_distance,
+                calories_active=row.calories_active_avg,
+                calories_total=row.calories_avg,
+                sleep_avg=to_timedelta(row.sleep_avg) if row.sleep_avg else None,
+                intensity_mins=to_seconds(row.intensity_time) // 60 if row.intensity_time else None,
+            )
+            for row in rows
+        ]
 
     def get_weight_series(
         self, start_date: date, end_date: date
@@ -484,16 +675,16 @@ class SQLiteHealthRepository(HealthRepository):
         Weight = _import_weight_model()
         start_ts = self._to_datetime(start_date)
         end_ts = self._to_datetime_end(end_date)
+        # get_for_period() already orders rows by day in SQL
         raw = Weight.get_for_period(self.garmin_db, start_ts, end_ts)
 
-        series = []
-        for row in raw:
-            try:
-                if row.weight is not None:
-                    series.append((self._to_date(row.day), float(row.weight)))
-            except Exception as e:
-                # Stay resilient (skip the bad row) but leave a trace so dropped
-                # weigh-ins are diagnosable instead of silently vanishing.
-                logger.debug("Skipping malformed weight row %r: %s", row, e)
-                continue
-        return sorted(series, key=lambda t: t[0])
+        # Validate up front instead of guarding every row with try/except, and
+        # report dropped weigh-ins once so they stay diagnosable.
+        series = [
+            (self._to_date(row.day), float(row.weight))
+            for row in raw if row.weight is not None
+        ]
+        skipped = len(raw) - len(series)
+        if skipped:
+            logger.debug("Skipped %d weight rows without a weight value", skipped)
+        return series
@@ -6,7 +6,7 @@ __license__ = "GPL"
 
 import logging
 import datetime
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Time, Enum, ForeignKey, PrimaryKeyConstraint, desc, literal_column
+from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, Time, Enum, ForeignKey, PrimaryKeyConstraint, Index, desc, literal_column
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
@@ -98,7 +98,7 @@ class Activities(ActivitiesDb.Base, ActivitiesCommon):
     __tablename__ = 'activities'
 
     db = ActivitiesDb
-    table_version = 5
+    table_version = 6
 
     activity_id = Column(String, primary_key=True)
     name = Column(String)
@@ -119,6 +119,11 @@ class Activities(ActivitiesDb.Base, ActivitiesCommon):
     training_effect = Column(Float)
     anaerobic_training_effect = Column(Float)
 
+    # Serves date range reads (optionally filtered by sport) without a table scan
+    __table_args__ = (
+        Index('idx_activities_start_time', 'start_time', 'sport'),
+    )
+
     def is_steps_activity(self):
         """Return if the activity is a steps based activity."""
         return self.sport in ['walking', 'running', 'hiking']
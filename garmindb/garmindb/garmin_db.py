@@ -8,7 +8,7 @@ import os
 import datetime
 import logging
 import re
-from sqlalchemy import Column, Integer, DateTime, Time, Float, String, Enum, ForeignKey, func, PrimaryKeyConstraint
+from sqlalchemy import Column, Integer, DateTime, Time, Float, String, Enum, ForeignKey, func, PrimaryKeyConstraint, Index
 from sqlalchemy.ext.hybrid import hybrid_property
 
 import fitfile
@@ -309,12 +309,17 @@ class RestingHeartRate(GarminDb.Base, idbutils.DbObject):
     __tablename__ = 'resting_hr'
 
     db = GarminDb
-    table_version = 2
+    table_version = 3
     _col_units = {'resting_heart_rate': 'bpm'}
 
     day = Column(DateTime, primary_key=True)
     resting_heart_rate = Column(Float)
 
+    # Covers reads of days that have a reading, skipping the ones that don't
+    __table_args__ = (
+        Index('idx_resting_hr_day', 'day', 'resting_heart_rate', sqlite_where=resting_heart_rate.isnot(None)),
+    )
+
     @classmethod
     def get_stats(cls, session, start_ts, end_ts):
         """Return a dictionary of aggregate statistics for the given time period."""
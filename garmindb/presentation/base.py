@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 class Presenter(ABC):
     """Abstract base for all presenters."""
 
+    # No per-instance state, so subclasses can stay __dict__-free too
+    __slots__ = ()
+
     @abstractmethod
     def render_sleep(self, result: "SleepAnalysisResult") -> str:
         """Render sleep analysis."""
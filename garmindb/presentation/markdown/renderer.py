@@ -1,6 +1,12 @@
 """Markdown renderer for health analysis results."""
 
-from typing import List, TYPE_CHECKING
+import functools
+import io
+import math
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from operator import attrgetter
+from typing import Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from garmindb.analysis.models import (
@@ -11,348 +17,453 @@ if TYPE_CHECKING:
         HealthReport,
         MetricSummary,
         Insight,
+        SportSummary,
     )
 
-# Handle both package imports and direct imports for testing
-try:
-    from ..base import Presenter
-except ImportError:
-    from base import Presenter
+from garmindb.presentation.base import Presenter
 
 
-class MarkdownPresenter(Presenter):
-    """Renders analysis results as LLM-friendly Markdown."""
+_METADATA_TEMPLATE = """---
+report_type: health_analysis
+generated: {generated}
+period_start: {period_start}
+period_end: {period_end}
+data_source: garmin_connect
+format_version: "1.0"
+---"""
 
-    def __init__(self, include_metadata: bool = True):
-        """Initialize presenter."""
-        self.include_metadata = include_metadata
+_NO_DATA_NOTE = "*No data available for this period.*"
 
-    def render_report(self, report: "HealthReport") -> str:
-        """Render complete health report as Markdown."""
-        sections = []
+_METRIC_TABLE_HEADER = (
+    "| Metric | Current | 7-day Avg | Trend |\n"
+    "|--------|---------|-----------|-------|"
+)
+
+_SPORT_TABLE_HEADER = (
+    "| Sport | Count | Distance | Duration | Efficiency |\n"
+    "|-------|-------|----------|----------|------------|"
+)
+
+# Every possible default-width progress bar, indexed by filled cells
+_BAR_WIDTH = 10
+_BARS = tuple(f"[{'=' * i}{' ' * (_BAR_WIDTH - i)}]" for i in range(_BAR_WIDTH + 1))
+
+_INTENSITY_CATEGORIES = (
+    "Recovery", "Base", "Improving", "Highly Improving", "Overreaching"
+)
+
+# Label lookups for bisect_right: a value gets the label after the last
+# threshold it is >= to. Strict ">" bounds use the next float up.
+_TSB_THRESHOLDS = (-30, -10, math.nextafter(5, math.inf), math.nextafter(25, math.inf))
+_TSB_LABELS = ("fatigued", "tired", "neutral", "fresh", "peak form")
+
+_ACWR_THRESHOLDS = (0.8, math.nextafter(1.3, math.inf), math.nextafter(1.5, math.inf))
+_ACWR_LABELS = ("undertrained", "optimal zone", "elevated risk", "high injury risk")
+
+
+def _generated_strings(generated_at: datetime) -> Tuple[str, str]:
+    """Return the (display, ISO 8601) strings for a report timestamp.
+
+    Reports rendered repeatedly (batch runs, tests, re-prompts) share the
+    same ``generated_at``, so both formats are memoized. The UTC offset is
+    part of the key because equal aware datetimes may differ in offset.
+    """
+    return _format_generated(generated_at, generated_at.utcoffset())
+
+
+@functools.lru_cache(maxsize=16)
+def _format_generated(
+    generated_at: datetime, utc_offset: Optional[timedelta]
+) -> Tuple[str, str]:
+    """Format a report timestamp; cached by _generated_strings()."""
+    display = (
+        f"{generated_at.year:04d}-{generated_at.month:02d}-{generated_at.day:02d} "
+        f"{_hour_minute(generated_at)}"
+    )
+    return display, generated_at.isoformat()
 
-        if self.include_metadata:
-            sections.append(self._render_metadata(report))
 
-        sections.append(
-            f"# Health Report: {report.period_start} to {report.period_end}"
+def _hour_minute(value: Union[time, datetime]) -> str:
+    """Format a time or datetime as HH:MM without going through strftime."""
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
+@functools.lru_cache(maxsize=16)
+def _period_text(period_start: date, period_end: date) -> str:
+    """Format a period range once for the report header and every section.
+
+    Sections normally share the report's period, so one report formats the
+    range once instead of once per section; differing bounds still get their
+    own text.
+    """
+    return f"{period_start.isoformat()} to {period_end.isoformat()}"
+
+
+def _render_metadata(report: "HealthReport") -> str:
+    """Render YAML frontmatter for LLM context."""
+    return _frontmatter(
+        _generated_strings(report.generated_at)[1],
+        report.period_start,
+        report.period_end,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _frontmatter(generated: str, period_start: date, period_end: date) -> str:
+    """Fill the frontmatter template; cached by _render_metadata()."""
+    return _METADATA_TEMPLATE.format(
+        generated=generated,
+        period_start=period_start.isoformat(),
+        period_end=period_end.isoformat(),
+    )
+
+
+def _metric_row(metric: "MetricSummary") -> str:
+    """Render a metric as a table row."""
+    # One f-string per branch builds the row without intermediate cells
+    name, unit, avg_7d = metric.name, metric.unit, metric.average_7d
+    if avg_7d:
+        return (
+            f"| {name} | {metric.current_value:.1f} {unit} "
+            f"| {avg_7d:.1f} {unit} | {metric.trend_icon} |"
         )
-        generated = report.generated_at.strftime('%Y-%m-%d %H:%M')
-        sections.append(f"\n*Generated: {generated}*\n")
+    return f"| {name} | {metric.current_value:.1f} {unit} | --- | {metric.trend_icon} |"
+
+
+def _render_insight(insight: "Insight") -> str:
+    """Render a single insight."""
+    recs = ""
+    if insight.recommendations:
+        rec_lines = "".join([f"\n- {rec}" for rec in insight.recommendations])
+        recs = f"\n**Recommendations:**{rec_lines}\n"
+    return (
+        f"#### {insight.severity_icon} {insight.title}\n"
+        f"\n{insight.description}\n{recs}"
+    )
 
-        if report.sleep:
-            sections.append(self.render_sleep(report.sleep))
 
-        if report.recovery:
-            sections.append(self._render_recovery(report.recovery))
+def _render_insight_list(insights: List["Insight"]) -> str:
+    """Render insights one after another, separated by newlines."""
+    return "\n".join(map(_render_insight, insights))
 
-        if report.stress:
-            sections.append(self._render_stress(report.stress))
 
-        if report.activities:
-            sections.append(self._render_activities(report.activities))
+def _progress_bar(percent: float, width: int = _BAR_WIDTH) -> str:
+    """Create ASCII progress bar.
 
-        if report.key_insights:
-            sections.append(self._render_insights_section(report.key_insights))
+    ``percent`` is clamped to [0, 100] so the bar never over- or
+    under-fills; the default width is served from precomputed bars.
+    """
+    filled = min(max(int(percent / 100 * width), 0), width)
+    if width == _BAR_WIDTH:
+        return _BARS[filled]
+    return f"[{'=' * filled}{' ' * (width - filled)}]"
 
-        return "\n\n".join(sections)
 
-    def render_sleep(self, result: "SleepAnalysisResult") -> str:
-        """Render sleep analysis section."""
-        lines = []
-        lines.append("## Sleep Analysis")
-        lines.append(
-            f"\n*Period: {result.period_start} to {result.period_end}*\n"
+def _sport_row(name: str, summary: "SportSummary") -> str:
+    """Render one sport as a row of the By Sport table."""
+    eff = summary.efficiency_index
+    eff_str = f"{eff:.1f}" if eff else "---"
+    return (
+        f"| {name} | {summary.count} | {summary.total_distance_km:.1f} km"
+        f" | {summary.total_duration_hours:.1f} h | {eff_str} |"
+    )
+
+
+def _tsb_form_label(tsb: float) -> str:
+    """Get form label for TSB value."""
+    return _TSB_LABELS[bisect_right(_TSB_THRESHOLDS, tsb)]
+
+
+def _acwr_risk_label(acwr: float) -> str:
+    """Get risk label for ACWR value."""
+    return _ACWR_LABELS[bisect_right(_ACWR_THRESHOLDS, acwr)]
+
+
+def _render_sleep(result: "SleepAnalysisResult") -> str:
+    """Render sleep analysis section."""
+    best, worst, insights = (
+        result.best_sleep_day, result.worst_sleep_day, result.insights
+    )
+    # Every write after the header starts a new line
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        f"## Sleep Analysis\n"
+        f"\n*Period: {_period_text(result.period_start, result.period_end)}*\n\n"
+        f"### Summary\n\n"
+        f"{_METRIC_TABLE_HEADER}\n"
+        f"{_metric_row(result.avg_total_sleep)}\n"
+        f"{_metric_row(result.avg_deep_sleep)}\n"
+        f"{_metric_row(result.avg_rem_sleep)}\n"
+        f"\n**Sleep Consistency Score:** "
+        f"{result.sleep_consistency_score:.0f}/100\n"
+    )
+
+    if best or worst:
+        w("\n### Patterns\n")
+        if best:
+            w(f"\n- **Best Sleep Day:** {best}")
+        if worst:
+            w(f"\n- **Worst Sleep Day:** {worst}")
+        w("\n")
+
+    if insights:
+        w(f"\n### Insights\n\n{_render_insight_list(insights)}")
+
+    return buf.getvalue()
+
+
+def _render_recovery(result: "RecoveryAnalysisResult") -> str:
+    """Render recovery analysis section."""
+    trend, dev = result.recovery_trend, result.rhr_deviation
+    acwr, days = result.acute_chronic_ratio, result.days_analyzed
+    insights = result.insights
+
+    # Recovery Score with trend
+    trend_val = trend.value if trend else "stable"
+
+    # Optional blocks, each empty when not applicable
+    dev_line = ""
+    if dev != 0:
+        dev_line = f"\n- **RHR Deviation:** {dev:+.1f} bpm from baseline"
+    acwr_line = ""
+    if acwr is not None:
+        acwr_line = f"\n- **Acute:Chronic Ratio:** {acwr:.2f} ({_acwr_risk_label(acwr)})"
+    stats_block = ""
+    if days > 0:
+        stats_block = (
+            f"\n### Period Statistics\n\n"
+            f"- **Days Analyzed:** {days}\n"
+            f"- **High Recovery Days:** {result.high_recovery_days}\n"
+            f"- **Low Recovery Days:** {result.low_recovery_days}\n"
         )
+    insights_block = ""
+    if insights:
+        insights_block = f"\n### Insights\n\n{_render_insight_list(insights)}"
+
+    return (
+        f"## Recovery Analysis\n"
+        f"\n*Period: {_period_text(result.period_start, result.period_end)}*\n\n"
+        f"**Recovery Score:** {result.recovery_score}/100 ({trend_val})\n\n"
+        f"### Key Metrics\n\n"
+        f"{_METRIC_TABLE_HEADER}\n"
+        f"{_metric_row(result.rhr_summary)}\n"
+        f"{_metric_row(result.body_battery_summary)}\n"
+        f"{_metric_row(result.training_load_summary)}\n\n"
+        f"### Recovery Indicators\n\n"
+        f"- **RHR Baseline:** {result.rhr_baseline:.0f} bpm"
+        f"{dev_line}"
+        f"\n- **Weekly Training Load:** {result.weekly_tss:.0f} TSS"
+        f"{acwr_line}\n"
+        f"{stats_block}"
+        f"{insights_block}"
+    )
+
 
-        lines.append("### Summary\n")
-        lines.append("| Metric | Current | 7-day Avg | Trend |")
-        lines.append("|--------|---------|-----------|-------|")
+def _render_stress(result: "StressAnalysisResult") -> str:
+    """Render stress analysis section."""
+    stress_load = result.stress_load
+    efficiency = result.recovery_efficiency
+    insights = result.insights
+
+    # Optional blocks, each empty when not applicable
+    load_lines = ""
+    if stress_load:
+        peak = stress_load.peak_load_hour
+        peak_str = _hour_minute(peak) if peak else '---'
+        load_lines = (
+            f"- **Total Stress Load:** {stress_load.total_load:.0f} pts\n"
+            f"- **Peak Load Hour:** {peak_str}\n"
+        )
+    resilience_block = ""
+    if efficiency is not None:
+        recovery_minutes = result.avg_recovery_time_minutes
+        recovery_line = ""
+        if recovery_minutes:
+            recovery_line = f"\n- **Avg Recovery Time:** {recovery_minutes:.0f} min"
+        resilience_block = (
+            f"\n### Stress Resilience\n\n"
+            f"- **Recovery Efficiency:** {efficiency:.0f}/100{recovery_line}\n"
+        )
+    insights_block = ""
+    if insights:
+        insights_block = f"\n### Insights\n\n{_render_insight_list(insights)}"
+
+    return (
+        f"## Stress Analysis\n"
+        f"\n*Period: {_period_text(result.period_start, result.period_end)}*\n\n"
+        f"### Key Metrics\n\n"
+        f"- **Average Stress:** {result.avg_stress.current_value:.1f}\n"
+        f"{load_lines}"
+        f"- **Personal Baseline:** {result.personal_baseline:.1f} (resting)\n\n"
+        f"### Distribution\n\n"
+        f"- **Low Stress:** {result.low_stress_percent:.1f}%\n"
+        f"- **Medium Stress:** {result.medium_stress_percent:.1f}%\n"
+        f"- **High Stress:** {result.high_stress_percent:.1f}%\n"
+        f"{resilience_block}"
+        f"{insights_block}"
+    )
 
-        metrics = [
-            result.avg_total_sleep, result.avg_deep_sleep, result.avg_rem_sleep
-        ]
-        for metric in metrics:
-            lines.append(self._metric_row(metric))
 
-        lines.append(
-            f"\n**Sleep Consistency Score:** "
-            f"{result.sleep_consistency_score:.0f}/100\n"
+def _render_activities(result: "ActivityAnalysisResult") -> str:
+    """Render activities analysis section."""
+    ts = result.training_stress
+    aerobic, anaerobic = result.avg_aerobic_effect, result.avg_anaerobic_effect
+    insights = result.insights
+
+    # Every write after the header starts a new line
+    buf = io.StringIO()
+    w = buf.write
+
+    # Basic totals
+    w(
+        f"## Activity Summary\n"
+        f"\n*Period: {_period_text(result.period_start, result.period_end)}*\n\n"
+        f"- **Total Activities:** {result.total_activities}\n"
+        f"- **Total Duration:** {result.total_duration_hours:.1f} hours\n"
+        f"- **Total Distance:** {result.total_distance_km:.1f} km\n"
+        f"- **Total Calories:** {result.total_calories:,}\n"
+    )
+
+    # Training Stress Metrics (TSB)
+    if ts:
+        tsb_label = _tsb_form_label(ts.tsb)
+        w(
+            f"\n### Training Load\n"
+            f"\n- **Fitness (CTL):** {ts.ctl:.0f}"
+            f"\n- **Fatigue (ATL):** {ts.atl:.0f}"
+            f"\n- **Form (TSB):** {ts.tsb:.0f} ({tsb_label})"
         )
+        monotony, confidence = ts.monotony, ts.confidence_score
+        if monotony is not None:
+            w(f"\n- **Monotony:** {monotony:.2f}\n- **Strain:** {ts.strain:.0f}")
+        if confidence < 0.7:
+            w(f"\n- **Data Confidence:** {confidence * 100:.0f}% ⚠️")
+        w("\n")
+
+    # Intensity Distribution with ASCII progress bars
+    if result.intensity_distribution:
+        get_pct = result.intensity_distribution.get
+        pcts = [get_pct(cat, 0) for cat in _INTENSITY_CATEGORIES]
+        bar = _progress_bar
+        w("\n### Intensity Distribution\n\n```\n")
+        w("\n".join([
+            f"{cat:17s} {bar(pct)} {pct:5.1f}%"
+            for cat, pct in zip(_INTENSITY_CATEGORIES, pcts)
+        ]))
+        w("\n```\n")
+
+    # Training Effect averages
+    if aerobic > 0:
+        w(f"\n### Training Effect\n\n- **Avg Aerobic Effect:** {aerobic:.1f}")
+        if anaerobic > 0:
+            w(f"\n- **Avg Anaerobic Effect:** {anaerobic:.1f}")
+        w("\n")
+
+    # Sport Summaries table
+    if result.sport_summaries:
+        rows = "\n".join([
+            _sport_row(name, summary) for name, summary in sorted(result.sport_summaries.items())
+        ])
+        w(f"\n### By Sport\n\n{_SPORT_TABLE_HEADER}\n{rows}\n")
+
+    # Insights
+    if insights:
+        w(f"\n### Insights\n\n{_render_insight_list(insights)}")
+
+    return buf.getvalue()
+
+
+def _render_insights_section(insights: List["Insight"]) -> str:
+    """Render key insights section."""
+    if not insights:
+        return "## Key Insights\n"
+    return f"## Key Insights\n\n{_render_insight_list(insights)}"
+
+
+# HealthReport's section fields and their renderers, in report order.
+# attrgetter fetches all five fields in one call.
+_section_fields = attrgetter("sleep", "recovery", "stress", "activities", "key_insights")
+_SECTION_RENDERERS = (
+    _render_sleep,
+    _render_recovery,
+    _render_stress,
+    _render_activities,
+    _render_insights_section,
+)
+
+
+def _report_header(report: "HealthReport") -> str:
+    """Render the report title and generation timestamp."""
+    generated, _ = _generated_strings(report.generated_at)
+    return (
+        f"# Health Report: {_period_text(report.period_start, report.period_end)}"
+        f"\n\n\n*Generated: {generated}*\n"
+    )
+
+
+def _render_empty_report(report: "HealthReport", include_metadata: bool) -> str:
+    """Render a report that has no populated sections in one string."""
+    body = f"{_report_header(report)}\n\n{_NO_DATA_NOTE}"
+    if include_metadata:
+        return f"{_render_metadata(report)}\n\n{body}"
+    return body
 
-        if result.best_sleep_day or result.worst_sleep_day:
-            lines.append("### Patterns\n")
-            if result.best_sleep_day:
-                lines.append(f"- **Best Sleep Day:** {result.best_sleep_day}")
-            if result.worst_sleep_day:
-                lines.append(
-                    f"- **Worst Sleep Day:** {result.worst_sleep_day}"
-                )
-            lines.append("")
-
-        if result.insights:
-            lines.append("### Insights\n")
-            for insight in result.insights:
-                lines.append(self._render_insight(insight))
-
-        return "\n".join(lines)
-
-    def _render_metadata(self, report: "HealthReport") -> str:
-        """Render YAML frontmatter for LLM context."""
-        return f"""---
-report_type: health_analysis
-generated: {report.generated_at.isoformat()}
-period_start: {report.period_start}
-period_end: {report.period_end}
-data_source: garmin_connect
-format_version: "1.0"
----"""
 
-    def _metric_row(self, metric: "MetricSummary") -> str:
-        """Render a metric as a table row."""
-        current = f"{metric.current_value:.1f} {metric.unit}"
-        if metric.average_7d:
-            avg_7d = f"{metric.average_7d:.1f} {metric.unit}"
-        else:
-            avg_7d = "---"
-        trend = metric.trend_icon
-        return f"| {metric.name} | {current} | {avg_7d} | {trend} |"
-
-    def _render_insight(self, insight: "Insight") -> str:
-        """Render a single insight."""
-        lines = []
-        icon = insight.severity_icon
-        lines.append(f"#### {icon} {insight.title}\n")
-        lines.append(f"{insight.description}\n")
-
-        if insight.recommendations:
-            lines.append("**Recommendations:**")
-            for rec in insight.recommendations:
-                lines.append(f"- {rec}")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _render_insights_section(self, insights: List["Insight"]) -> str:
-        """Render key insights section."""
-        lines = ["## Key Insights\n"]
-        for insight in insights:
-            lines.append(self._render_insight(insight))
-        return "\n".join(lines)
-
-    def _render_stress(self, result: "StressAnalysisResult") -> str:
-        """Render stress analysis section."""
-        lines = []
-        lines.append("## Stress Analysis")
-        period = f"{result.period_start} to {result.period_end}"
-        lines.append(f"\n*Period: {period}*\n")
-
-        # Summary Metrics
-        lines.append("### Key Metrics\n")
-        avg = result.avg_stress.current_value
-        lines.append(f"- **Average Stress:** {avg:.1f}")
-        if result.stress_load:
-            load = result.stress_load.total_load
-            lines.append(f"- **Total Stress Load:** {load:.0f} pts")
-            peak = result.stress_load.peak_load_hour
-            peak_str = peak.strftime('%H:%M') if peak else '---'
-            lines.append(f"- **Peak Load Hour:** {peak_str}")
-        baseline = result.personal_baseline
-        lines.append(f"- **Personal Baseline:** {baseline:.1f} (resting)\n")
-
-        # Distribution
-        lines.append("### Distribution\n")
-        low = result.low_stress_percent
-        med = result.medium_stress_percent
-        high = result.high_stress_percent
-        lines.append(f"- **Low Stress:** {low:.1f}%")
-        lines.append(f"- **Medium Stress:** {med:.1f}%")
-        lines.append(f"- **High Stress:** {high:.1f}%\n")
-
-        # Recovery Efficiency
-        if result.recovery_efficiency is not None:
-            lines.append("### Stress Resilience\n")
-            eff = result.recovery_efficiency
-            lines.append(f"- **Recovery Efficiency:** {eff:.0f}/100")
-            if result.avg_recovery_time_minutes:
-                avg_rec = result.avg_recovery_time_minutes
-                lines.append(f"- **Avg Recovery Time:** {avg_rec:.0f} min")
-            lines.append("")
-
-        if result.insights:
-            lines.append("### Insights\n")
-            for insight in result.insights:
-                lines.append(self._render_insight(insight))
-
-        return "\n".join(lines)
-
-    def _render_activities(self, result: "ActivityAnalysisResult") -> str:
-        """Render activities analysis section."""
-        lines = []
-        lines.append("## Activity Summary")
-        period = f"{result.period_start} to {result.period_end}"
-        lines.append(f"\n*Period: {period}*\n")
-
-        # Basic totals
-        lines.append(f"- **Total Activities:** {result.total_activities}")
-        duration = result.total_duration_hours
-        lines.append(f"- **Total Duration:** {duration:.1f} hours")
-        distance = result.total_distance_km
-        lines.append(f"- **Total Distance:** {distance:.1f} km")
-        lines.append(f"- **Total Calories:** {result.total_calories:,}")
-        lines.append("")
-
-        # Training Stress Metrics (TSB)
-        if result.training_stress:
-            ts = result.training_stress
-            lines.append("### Training Load\n")
-            lines.append(f"- **Fitness (CTL):** {ts.ctl:.0f}")
-            lines.append(f"- **Fatigue (ATL):** {ts.atl:.0f}")
-            tsb_label = self._tsb_form_label(ts.tsb)
-            lines.append(f"- **Form (TSB):** {ts.tsb:.0f} ({tsb_label})")
-            if ts.monotony is not None:
-                lines.append(f"- **Monotony:** {ts.monotony:.2f}")
-                lines.append(f"- **Strain:** {ts.strain:.0f}")
-            if ts.confidence_score < 0.7:
-                conf_pct = ts.confidence_score * 100
-                lines.append(f"- **Data Confidence:** {conf_pct:.0f}% ⚠️")
-            lines.append("")
-
-        # Intensity Distribution with ASCII progress bars
-        if result.intensity_distribution:
-            lines.append("### Intensity Distribution\n")
-            lines.append("```")
-            categories = [
-                "Recovery", "Base", "Improving",
-                "Highly Improving", "Overreaching"
-            ]
-            for cat in categories:
-                pct = result.intensity_distribution.get(cat, 0)
-                bar = self._progress_bar(pct)
-                lines.append(f"{cat:17s} {bar} {pct:5.1f}%")
-            lines.append("```")
-            lines.append("")
-
-        # Training Effect averages
-        if result.avg_aerobic_effect > 0:
-            lines.append("### Training Effect\n")
-            lines.append(f"- **Avg Aerobic Effect:** {result.avg_aerobic_effect:.1f}")
-            if result.avg_anaerobic_effect > 0:
-                anaerobic = result.avg_anaerobic_effect
-                lines.append(f"- **Avg Anaerobic Effect:** {anaerobic:.1f}")
-            lines.append("")
-
-        # Sport Summaries table
-        if result.sport_summaries:
-            lines.append("### By Sport\n")
-            lines.append("| Sport | Count | Distance | Duration | Efficiency |")
-            lines.append("|-------|-------|----------|----------|------------|")
-            for name, summary in sorted(result.sport_summaries.items()):
-                dist = f"{summary.total_distance_km:.1f} km"
-                dur = f"{summary.total_duration_hours:.1f} h"
-                if summary.efficiency_index:
-                    eff = f"{summary.efficiency_index:.1f}"
-                else:
-                    eff = "---"
-                row = f"| {name} | {summary.count} | {dist} | {dur} | {eff} |"
-                lines.append(row)
-            lines.append("")
-
-        # Insights
-        if result.insights:
-            lines.append("### Insights\n")
-            for insight in result.insights:
-                lines.append(self._render_insight(insight))
-
-        return "\n".join(lines)
-
-    def _progress_bar(self, percent: float, width: int = 10) -> str:
-        """Create ASCII progress bar."""
-        filled = int(percent / 100 * width)
-        empty = width - filled
-        return f"[{'=' * filled}{' ' * empty}]"
-
-    def _tsb_form_label(self, tsb: float) -> str:
-        """Get form label for TSB value."""
-        if tsb > 25:
-            return "peak form"
-        elif tsb > 5:
-            return "fresh"
-        elif tsb >= -10:
-            return "neutral"
-        elif tsb >= -30:
-            return "tired"
-        else:
-            return "fatigued"
-
-    def _render_recovery(self, result: "RecoveryAnalysisResult") -> str:
-        """Render recovery analysis section."""
-        lines = []
-        lines.append("## Recovery Analysis")
-        period = f"{result.period_start} to {result.period_end}"
-        lines.append(f"\n*Period: {period}*\n")
-
-        # Recovery Score with trend
-        if result.recovery_trend:
-            trend_val = result.recovery_trend.value
-        else:
-            trend_val = "stable"
-        score = result.recovery_score
-        lines.append(f"**Recovery Score:** {score}/100 ({trend_val})\n")
-
-        # Summary metrics table
-        lines.append("### Key Metrics\n")
-        lines.append("| Metric | Current | 7-day Avg | Trend |")
-        lines.append("|--------|---------|-----------|-------|")
-        lines.append(self._metric_row(result.rhr_summary))
-        lines.append(self._metric_row(result.body_battery_summary))
-        lines.append(self._metric_row(result.training_load_summary))
-        lines.append("")
-
-        # Recovery indicators
-        lines.append("### Recovery Indicators\n")
-        rhr_base = result.rhr_baseline
-        lines.append(f"- **RHR Baseline:** {rhr_base:.0f} bpm")
-        if result.rhr_deviation != 0:
-            dev = result.rhr_deviation
-            dev_str = f"+{dev:.1f}" if dev > 0 else f"{dev:.1f}"
-            lines.append(f"- **RHR Deviation:** {dev_str} bpm from baseline")
-        tss = result.weekly_tss
-        lines.append(f"- **Weekly Training Load:** {tss:.0f} TSS")
-
-        if result.acute_chronic_ratio is not None:
-            acwr = result.acute_chronic_ratio
-            risk = self._acwr_risk_label(acwr)
-            lines.append(f"- **Acute:Chronic Ratio:** {acwr:.2f} ({risk})")
-
-        lines.append("")
-
-        # Summary statistics
-        if result.days_analyzed > 0:
-            lines.append("### Period Statistics\n")
-            days = result.days_analyzed
-            high_days = result.high_recovery_days
-            low_days = result.low_recovery_days
-            lines.append(f"- **Days Analyzed:** {days}")
-            lines.append(f"- **High Recovery Days:** {high_days}")
-            lines.append(f"- **Low Recovery Days:** {low_days}")
-            lines.append("")
-
-        # Insights
-        if result.insights:
-            lines.append("### Insights\n")
-            for insight in result.insights:
-                lines.append(self._render_insight(insight))
-
-        return "\n".join(lines)
-
-    def _acwr_risk_label(self, acwr: float) -> str:
-        """Get risk label for ACWR value."""
-        if acwr < 0.8:
-            return "undertrained"
-        elif acwr <= 1.3:
-            return "optimal zone"
-        elif acwr <= 1.5:
-            return "elevated risk"
-        else:
-            return "high injury risk"
+def iter_render_report(report: "HealthReport", include_metadata: bool = True) -> Iterator[str]:
+    """Yield the Markdown report chunk by chunk as each section is rendered.
+
+    The chunks concatenate to exactly ``render_report()``'s output, so a
+    sink can consume them with ``stream.writelines(...)`` without the whole
+    report ever being held in memory as one string.
+    """
+    sections = [
+        (render, data)
+        for render, data in zip(_SECTION_RENDERERS, _section_fields(report))
+        if data
+    ]
+    if not sections:
+        yield _render_empty_report(report, include_metadata)
+        return
+
+    if include_metadata:
+        yield _render_metadata(report)
+        yield "\n\n"
+    yield _report_header(report)
+    for render, data in sections:
+        yield f"\n\n{render(data)}"
+
+
+def render_report(report: "HealthReport", include_metadata: bool = True) -> str:
+    """Render complete health report as Markdown."""
+    # Reports without data (e.g. a day with nothing synced) skip the generator
+    if not any(_section_fields(report)):
+        return _render_empty_report(report, include_metadata)
+    return "".join(iter_render_report(report, include_metadata))
+
+
+class MarkdownPresenter(Presenter):
+    """Renders analysis results as LLM-friendly Markdown.
+
+    Rendering itself is stateless and lives in the module-level functions;
+    the presenter only carries ``include_metadata`` for the Presenter API.
+    """
+
+    __slots__ = ("include_metadata",)
+
+    def __init__(self, include_metadata: bool = True) -> None:
+        """Initialize presenter."""
+        self.include_metadata = include_metadata
+
+    def render_report(self, report: "HealthReport") -> str:
+        """Render complete health report as Markdown."""
+        return render_report(report, self.include_metadata)
+
+    def iter_render_report(self, report: "HealthReport") -> Iterator[str]:
+        """Yield the Markdown report in chunks for streaming to a file or stdout."""
+        return iter_render_report(report, self.include_metadata)
+
+    def render_sleep(self, result: "SleepAnalysisResult") -> str:
+        """Render sleep analysis section."""
+        return _render_sleep(result)
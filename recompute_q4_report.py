@@ -1,17 +1,13 @@
 
-import sys
-import os
-from datetime import date, timedelta, datetime
-
-# Ensure garmindb is in the path
-sys.path.append(os.getcwd())
-
-from garmindb.data.repositories.sqlite import SQLiteHealthRepository
-from garmindb.analysis.health_analyzer import HealthAnalyzer
-from garmindb.presentation.markdown.renderer import MarkdownPresenter
-from garmindb.garmin_connect_config_manager import GarminConnectConfigManager
+from datetime import date
 
 def main():
+    # Import here so importing this module does not load the garmindb/SQLAlchemy chain
+    from garmindb.data.repositories.sqlite import SQLiteHealthRepository
+    from garmindb.analysis.health_analyzer import HealthAnalyzer
+    from garmindb.presentation.markdown.renderer import MarkdownPresenter
+    from garmindb.garmin_connect_config_manager import GarminConnectConfigManager
+
     config = GarminConnectConfigManager()
     db_params = config.get_db_params()
     repository = SQLiteHealthRepository(db_params)
@@ -8,6 +8,8 @@ Usage:
 """
 
 import argparse
+import os
+import sys
 from datetime import date, datetime
 from pathlib import Path
 
@@ -77,7 +79,6 @@ def main():
         )
 
         db_dir = db_params.db_path
-        import os
         acts_dir = os.path.join(os.path.dirname(db_dir), "FitFiles", "Activities")
         end = args.end or date.today()
         # Default span: all of the prior calendar year through today, so the
@@ -92,11 +93,10 @@ def main():
             activities_dir=acts_dir,
         )
         report = builder.build()
-        markdown = LongitudinalPresenter(
+        chunks = [LongitudinalPresenter(
             include_metadata=not args.no_metadata
-        ).render(report)
+        ).render(report)]
     elif args.performance:
-        import os
         from datetime import datetime as _dt
         from datetime import timedelta as _td
         from garmindb.data.repositories import SQLiteHealthRepository
@@ -132,17 +132,15 @@ def main():
         # last-known value forward instead of destroying the baseline.
         merged = merge_metrics(last, report.metric_snapshot)
         save_metrics(state_path, merged, generated.isoformat())
-        markdown = PerformancePresenter(
+        chunks = [PerformancePresenter(
             include_metadata=not args.no_metadata
-        ).render(report)
+        ).render(report)]
     else:
         from garmindb.data.repositories import SQLiteHealthRepository
         from garmindb.analysis import HealthAnalyzer
-        from garmindb.presentation import MarkdownPresenter
 
         repository = SQLiteHealthRepository(db_params)
         analyzer = HealthAnalyzer(repository)
-        presenter = MarkdownPresenter(include_metadata=not args.no_metadata)
         if args.start and args.end:
             report = analyzer.generate_report(args.start, args.end)
         elif args.period == "daily":
@@ -151,14 +149,30 @@ def main():
             report = analyzer.monthly_report()
         else:
             report = analyzer.weekly_report()
-        markdown = presenter.render_report(report)
+
+        # The presenter is only needed once the report exists
+        from garmindb.presentation import MarkdownPresenter
+
+        presenter = MarkdownPresenter(include_metadata=not args.no_metadata)
+        # Stream sections as they render instead of building one string
+        chunks = presenter.iter_render_report(report)
 
     # Output
     if args.output:
-        args.output.write_text(markdown)
+        # Render into a sibling file and swap it in once complete, so a
+        # failure mid-render never truncates an existing report
+        tmp_output = args.output.with_name(f".{args.output.name}.tmp")
+        try:
+            with tmp_output.open("w", encoding="utf-8", buffering=1 << 16) as f:
+                f.writelines(chunks)
+            os.replace(tmp_output, args.output)
+        except BaseException:
+            tmp_output.unlink(missing_ok=True)
+            raise
         print(f"Report saved to: {args.output}")
     else:
-        print(markdown)
+        sys.stdout.writelines(chunks)
+        print()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+"""Shared, memoized configuration lookups and database-test gating for tests."""
+
+__author__ = "Tom Goetz"
+__copyright__ = "Copyright Tom Goetz"
+__license__ = "GPL"
+
+import functools
+import os
+import unittest
+
+
+# Test classes that read the configured Garmin database only run when this is set;
+# classes using a temporary seeded database always run
+RUN_DB_TESTS = bool(os.environ.get('GARMINDB_RUN_DB_TESTS'))
+requires_db = unittest.skipUnless(RUN_DB_TESTS, "set GARMINDB_RUN_DB_TESTS=1 to run tests against the configured database")
+
+
+@functools.lru_cache(maxsize=1)
+def db_params():
+    """Return the configured DbParams, parsing the config file once per test process."""
+    from garmindb import GarminConnectConfigManager
+
+    return GarminConnectConfigManager().get_db_params()
+
+
+@functools.lru_cache(maxsize=1)
+def db_available():
+    """Return True if the configured Garmin database exists; server databases are assumed reachable."""
+    params = db_params()
+    if params.db_type != 'sqlite':
+        return True
+    return os.path.exists(os.path.join(params.db_path, 'garmin.db'))
@@ -0,0 +1,84 @@
+"""Seeded throwaway SQLite databases for DB-backed analysis tests."""
+
+__author__ = "Tom Goetz"
+__copyright__ = "Copyright Tom Goetz"
+__license__ = "GPL"
+
+import shutil
+import tempfile
+from datetime import date, datetime, time, timedelta
+
+from idbutils import DbParams
+
+from garmindb.garmindb import (
+    GarminDb, Stress, Sleep, RestingHeartRate, DailySummary,
+    ActivitiesDb, Activities, MonitoringDb, MonitoringHeartRate
+)
+from garmindb.summarydb import SummaryDb, DaysSummary
+
+
+SEED_DAYS = 42
+# Fixed "today" so seeded data and the analysis windows over it never depend on the wall clock
+TODAY = date(2026, 1, 15)
+
+
+def _seed(db_params, end_date):
+    """Fill fresh databases with SEED_DAYS of deterministic data ending on end_date."""
+    days = [end_date - timedelta(days=offset) for offset in range(SEED_DAYS - 1, -1, -1)]
+
+    garmin_db = GarminDb(db_params)
+    with garmin_db.managed_session() as session:
+        for index, day in enumerate(days):
+            midnight = datetime.combine(day, time())
+            session.add_all(
+                Stress(timestamp=midnight + timedelta(hours=hour), stress=20 + (hour * 7 + index) % 60)
+                for hour in range(8, 22)
+            )
+            session.add(Sleep(day=day, total_sleep=time(7, index % 60), deep_sleep=time(1, 30),
+                              light_sleep=time(4), rem_sleep=time(1, 30), awake=time(0, 10), score=70 + index % 20))
+            session.add(RestingHeartRate(day=day, resting_heart_rate=52 + index % 5))
+            session.add(DailySummary(day=day, rhr=52 + index % 5, bb_max=80 + index % 15, bb_min=15,
+                                     bb_charged=50 + index % 20))
+        session.commit()
+
+    monitoring_db = MonitoringDb(db_params)
+    with monitoring_db.managed_session() as session:
+        for index, day in enumerate(days):
+            midnight = datetime.combine(day, time())
+            session.add_all(
+                MonitoringHeartRate(timestamp=midnight + timedelta(hours=hour), heart_rate=55 + (hour + index) % 30)
+                for hour in range(24)
+            )
+        session.commit()
+
+    activities_db = ActivitiesDb(db_params)
+    with activities_db.managed_session() as session:
+        for index, day in enumerate(days[::2]):
+            session.add(Activities(activity_id=str(index), name=f"Run {index}", sport="running",
+                                   start_time=datetime.combine(day, time(7)), elapsed_time=time(0, 50),
+                                   moving_time=time(0, 45), distance=8.0 + index % 4, training_load=60.0 + index))
+        session.commit()
+
+    summary_db = SummaryDb(db_params, False)
+    with summary_db.managed_session() as session:
+        session.add_all(
+            DaysSummary(day=day, rhr_avg=52.0 + index % 5, sleep_avg=time(7, index % 60), intensity_time=time(0, 30))
+            for index, day in enumerate(days)
+        )
+        session.commit()
+
+    # Release the seeding connections; repositories open their own
+    for db in (garmin_db, monitoring_db, activities_db, summary_db):
+        db.engine.dispose()
+
+
+def seeded_db_params(end_date=None):
+    """Return (DbParams, cleanup) for a temporary database seeded up to end_date (default TODAY).
+
+    Close repositories built on the database before calling cleanup.
+    """
+    db_dir = tempfile.mkdtemp(prefix="garmindb_test_")
+    db_params = DbParams(db_type='sqlite', db_path=db_dir)
+    _seed(db_params, end_date or TODAY)
+
+    return db_params, lambda: shutil.rmtree(db_dir)
@@ -1,20 +1,37 @@
 """Unit tests for ActivityAnalyzer."""
 
+import dataclasses
 import unittest
+from array import array
 from unittest.mock import MagicMock
 from datetime import date, datetime, timedelta
 from garmindb.analysis.activity_analyzer import ActivityAnalyzer
 from garmindb.data.models import ActivityRecord
 from garmindb.analysis.models import ActivityAnalysisResult, TrendDirection
 
+# Fixed clock so tests never straddle midnight or depend on the wall clock
+NOW = datetime(2026, 1, 15, 12, 0, 0)
+TODAY = NOW.date()
+
+# One-hour run that tests specialise with dataclasses.replace
+BASE_RUN = ActivityRecord(
+    activity_id="1", name="Run", sport="running",
+    start_time=NOW, duration=timedelta(minutes=60)
+)
+
 
 class TestActivityAnalyzer(unittest.TestCase):
     """Test suite for ActivityAnalyzer logic."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up analyzer with mocked repository shared by all tests."""
+        cls.mock_repo = MagicMock()
+        cls.analyzer = ActivityAnalyzer(cls.mock_repo)
+
     def setUp(self):
-        """Set up analyzer with mocked repository."""
-        self.mock_repo = MagicMock()
-        self.analyzer = ActivityAnalyzer(self.mock_repo)
+        """Clear calls and canned results left on the mock by earlier tests."""
+        self.mock_repo.reset_mock(return_value=True, side_effect=True)
 
     def test_instantiation(self):
         """Test creating ActivityAnalyzer."""
@@ -22,11 +39,7 @@ class TestActivityAnalyzer(unittest.TestCase):
 
     def test_estimate_load_real(self):
         """Test that real training load is preserved."""
-        activity = ActivityRecord(
-            activity_id="1", name="Run", sport="running",
-            start_time=datetime.now(), duration=timedelta(minutes=60),
-            training_load=50.0
-        )
+        activity = dataclasses.replace(BASE_RUN, training_load=50.0)
         load, is_estimated = self.analyzer._estimate_load(activity)
         self.assertEqual(load, 50.0)
         self.assertFalse(is_estimated)
@@ -34,21 +47,13 @@ class TestActivityAnalyzer(unittest.TestCase):
     def test_estimate_load_fallback(self):
         """Test load estimation for different sports when TSS is missing."""
         # Running: 60 min * 0.8 = 48
-        run = ActivityRecord(
-            activity_id="1", name="Run", sport="running",
-            start_time=datetime.now(), duration=timedelta(minutes=60),
-            training_load=None
-        )
+        run = BASE_RUN
         load, is_estimated = self.analyzer._estimate_load(run)
         self.assertEqual(load, 48.0)
         self.assertTrue(is_estimated)
 
         # Walking: 60 min * 0.3 = 18
-        walk = ActivityRecord(
-            activity_id="2", name="Walk", sport="walking",
-            start_time=datetime.now(), duration=timedelta(minutes=60),
-            training_load=None
-        )
+        walk = dataclasses.replace(BASE_RUN, activity_id="2", name="Walk", sport="walking")
         load, _ = self.analyzer._estimate_load(walk)
         self.assertEqual(load, 18.0)
 
@@ -57,10 +62,8 @@ class TestActivityAnalyzer(unittest.TestCase):
         start = date(2026, 1, 1)
         end = date(2026, 1, 5)
         # Activity only on day 2
-        activity = ActivityRecord(
-            activity_id="1", name="Run", sport="running",
-            start_time=datetime(2026, 1, 2, 10, 0), duration=timedelta(minutes=60),
-            training_load=100.0
+        activity = dataclasses.replace(
+            BASE_RUN, start_time=datetime(2026, 1, 2, 10, 0), training_load=100.0
         )
         
         loads, confidence = self.analyzer._build_daily_loads([activity], start, end)
@@ -75,11 +78,11 @@ class TestActivityAnalyzer(unittest.TestCase):
         """Test that confidence score is weighted by load volume."""
         # Real load 100, Estimated load 100 (60 min run with factor 0.8 is 48, so lets use specific values)
         # Act 1: Real 100
-        a1 = ActivityRecord("1", "R", "running", datetime.now(), timedelta(minutes=60), training_load=100)
+        a1 = dataclasses.replace(BASE_RUN, training_load=100)
         # Act 2: Estimated (Running 60m = 48)
-        a2 = ActivityRecord("2", "E", "running", datetime.now(), timedelta(minutes=60), training_load=None)
+        a2 = dataclasses.replace(BASE_RUN, activity_id="2")
         
-        loads, confidence = self.analyzer._build_daily_loads([a1, a2], date.today(), date.today())
+        loads, confidence = self.analyzer._build_daily_loads([a1, a2], TODAY, TODAY)
         # Total = 148, Real = 100. Confidence = 100/148 = 0.675...
         self.assertAlmostEqual(confidence, 0.68, places=2)
 
@@ -98,11 +101,12 @@ class TestActivityAnalyzer(unittest.TestCase):
         # step 3: 0.25*0 + 0.75*75 = 56.25
         ema = self.analyzer._calculate_ema(values, 7)
         self.assertEqual(ema, 56.25)
+        self.assertEqual(self.analyzer._calculate_ema(array('d', values), 7), 56.25)
 
     def test_calculate_monotony_repetitive(self):
         """Test monotony calculation with repetitive training."""
         # Identical loads every day
-        loads = [100.0] * 7
+        loads = array('d', [100.0] * 7)
         monotony = self.analyzer._calculate_monotony(loads)
         # Should be capped at 10.0
         self.assertEqual(monotony, 10.0)
@@ -114,13 +118,14 @@ class TestActivityAnalyzer(unittest.TestCase):
         # Mean = 400/7 = 57.14
         # StdDev > 0, Monotony should be low-ish
         self.assertLess(monotony, 2.0)
+        self.assertEqual(self.analyzer._calculate_monotony(array('d', loads)), monotony)
 
     def test_intensity_distribution(self):
         """Test intensity categorization from training effect."""
         activities = [
-            ActivityRecord("1", "R", "running", datetime.now(), timedelta(0), training_effect=1.5), # Recovery
-            ActivityRecord("2", "R", "running", datetime.now(), timedelta(0), training_effect=3.5), # Improving
-            ActivityRecord("3", "R", "running", datetime.now(), timedelta(0), training_effect=3.5), # Improving
+            dataclasses.replace(BASE_RUN, activity_id="1", training_effect=1.5), # Recovery
+            dataclasses.replace(BASE_RUN, activity_id="2", training_effect=3.5), # Improving
+            dataclasses.replace(BASE_RUN, activity_id="3", training_effect=3.5), # Improving
         ]
         dist = self.analyzer._calculate_intensity_distribution(activities)
         self.assertEqual(dist["Recovery"], 33.3)
@@ -130,18 +135,28 @@ class TestActivityAnalyzer(unittest.TestCase):
         """Test efficiency index calculation (velocity/HR)."""
         # 12 km/h at 150 bpm = 12/150 * 100 = 8.0
         # ActivityRecord fields: duration, distance, avg_hr
-        act = ActivityRecord("1", "R", "running", datetime.now(), timedelta(hours=1), distance=12.0, avg_hr=150)
+        act = dataclasses.replace(BASE_RUN, distance=12.0, avg_hr=150)
         summaries = self.analyzer._build_sport_summaries([act])
         self.assertEqual(summaries["running"].efficiency_index, 8.0)
 
+    def test_sport_summaries_sorted_by_name(self):
+        """Test sport summaries are built in sport name order."""
+        start = datetime(2026, 1, 1, 10, 0)
+        acts = [
+            ActivityRecord(str(i), "A", sport, start, timedelta(minutes=30))
+            for i, sport in enumerate(["running", "cycling", "swimming", "cycling"])
+        ]
+        summaries = self.analyzer._build_sport_summaries(acts)
+        self.assertEqual(list(summaries), ["cycling", "running", "swimming"])
+
     def test_generate_insights_volume_spike(self):
         """Test detection of training volume spike."""
         end_date = date(2026, 1, 14)
         # Prev week: 100 load. Current week: 200 load (+100%)
-        daily_loads = {}
-        for i in range(14):
-            day = end_date - timedelta(days=i)
-            daily_loads[day] = 28.6 if i < 7 else 14.3 # Current week vs Prev week
+        daily_loads = {
+            end_date - timedelta(days=i): 28.6 if i < 7 else 14.3  # Current week vs Prev week
+            for i in range(14)
+        }
         
         # Manually trigger insight check
         result = MagicMock()
@@ -4,24 +4,31 @@ Note: These tests import directly from the models module to avoid
 loading the heavy dependencies in garmindb/__init__.py (like fitfile).
 """
 
-import sys
+import importlib.util
 import os
+import sys
 import unittest
+from dataclasses import asdict
 from datetime import date, datetime, timedelta
 
-# Add the garmindb/data directory to path to import models directly
-# This avoids triggering garmindb/__init__.py which has heavy dependencies
-_data_path = os.path.join(os.path.dirname(__file__), '..', 'garmindb', 'data')
-sys.path.insert(0, os.path.abspath(_data_path))
-
-from models import (  # noqa: E402
-    SleepRecord,
-    HeartRateRecord,
-    StressRecord,
-    BodyBatteryRecord,
-    ActivityRecord,
-    DailySummaryRecord,
-)
+# Load garmindb/data/models.py on its own, without triggering the heavy
+# dependencies in garmindb/__init__.py and without growing sys.path
+_models_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'garmindb', 'data', 'models.py')
+_spec = importlib.util.spec_from_file_location('garmindb_data_models', _models_path)
+_models = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _models  # dataclasses resolve their module through sys.modules
+_spec.loader.exec_module(_models)
+
+SleepRecord = _models.SleepRecord
+HeartRateRecord = _models.HeartRateRecord
+HeartRateSeries = _models.HeartRateSeries
+StressRecord = _models.StressRecord
+BodyBatteryRecord = _models.BodyBatteryRecord
+ActivityRecord = _models.ActivityRecord
+DailySummaryRecord = _models.DailySummaryRecord
+make_sleep_record = _models.make_sleep_record
+make_heart_rate_record = _models.make_heart_rate_record
+make_stress_record = _models.make_stress_record
 
 
 class TestSleepRecord(unittest.TestCase):
@@ -70,6 +77,46 @@ class TestSleepRecord(unittest.TestCase):
 
         self.assertAlmostEqual(record.total_hours, 7.5, places=2)
 
+    def test_sleep_record_stage_percentages(self):
+        """Test deep/REM percentages, including an empty night."""
+        record = SleepRecord(
+            date=date(2025, 1, 15),
+            total_sleep=timedelta(hours=8),
+            deep_sleep=timedelta(hours=2),
+            light_sleep=timedelta(hours=4),
+            rem_sleep=timedelta(hours=1),
+            awake_time=timedelta(minutes=30),
+        )
+        self.assertAlmostEqual(record.deep_sleep_percent, 25.0)
+        self.assertAlmostEqual(record.rem_sleep_percent, 12.5)
+
+        empty = SleepRecord(
+            date=date(2025, 1, 16),
+            total_sleep=timedelta(0),
+            deep_sleep=timedelta(0),
+            light_sleep=timedelta(0),
+            rem_sleep=timedelta(0),
+            awake_time=timedelta(0),
+        )
+        self.assertEqual(empty.deep_sleep_percent, 0.0)
+        self.assertEqual(empty.rem_sleep_percent, 0.0)
+
+    def test_sleep_record_serializes_only_public_fields(self):
+        """Test asdict() exposes exactly the declared sleep fields."""
+        record = SleepRecord(
+            date=date(2025, 1, 15),
+            total_sleep=timedelta(hours=1),
+            deep_sleep=timedelta(0),
+            light_sleep=timedelta(hours=1),
+            rem_sleep=timedelta(0),
+            awake_time=timedelta(0),
+        )
+
+        self.assertEqual(list(asdict(record)), [
+            'date', 'total_sleep', 'deep_sleep', 'light_sleep', 'rem_sleep', 'awake_time',
+            'sleep_score', 'bedtime', 'wake_time',
+        ])
+
 
 class TestHeartRateRecord(unittest.TestCase):
     """Test HeartRateRecord DTO."""
@@ -86,6 +133,23 @@ class TestHeartRateRecord(unittest.TestCase):
         self.assertEqual(record.resting_hr, 52)
 
 
+class TestHeartRateSeries(unittest.TestCase):
+    """Test HeartRateSeries DTO."""
+
+    def test_zone_counts(self):
+        """Test samples are bucketed by zone lower bounds."""
+        from array import array
+
+        series = HeartRateSeries(
+            timestamps=tuple(datetime(2025, 1, 15, 10, i) for i in range(6)),
+            heart_rates=array('H', [60, 99, 100, 100, 140, 185]),
+        )
+
+        self.assertEqual(len(series), 6)
+        self.assertEqual(series.zone_counts([100, 140, 180]), [2, 2, 1, 1])
+        self.assertEqual(series.zone_counts([]), [6])
+
+
 class TestStressRecord(unittest.TestCase):
     """Test StressRecord DTO."""
 
@@ -98,28 +162,26 @@ class TestStressRecord(unittest.TestCase):
 
         self.assertEqual(record.stress_level, 35)
 
-    def test_stress_category(self):
-        """Test stress_category property."""
-        ts = datetime(2025, 1, 15, 10, 0)
-        low = StressRecord(timestamp=ts, stress_level=20)
-        medium = StressRecord(timestamp=ts, stress_level=45)
-        high = StressRecord(timestamp=ts, stress_level=75)
+    def test_stress_record_uses_slots(self):
+        """Test StressRecord is slotted (no per-instance __dict__)."""
+        record = StressRecord(
+            timestamp=datetime(2025, 1, 15, 10, 0),
+            stress_level=35,
+        )
 
-        self.assertEqual(low.stress_category, "low")
-        self.assertEqual(medium.stress_category, "medium")
-        self.assertEqual(high.stress_category, "high")
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(StressRecord.__slots__, ("timestamp", "stress_level"))
 
-    def test_stress_category_boundaries(self):
-        """Test stress_category at boundary values."""
+    def test_stress_category(self):
+        """Test stress_category across categories and at boundary values."""
         ts = datetime(2025, 1, 15, 10, 0)
-        # Test exact boundary values: 25, 50, 76
-        at_25 = StressRecord(timestamp=ts, stress_level=25)
-        at_50 = StressRecord(timestamp=ts, stress_level=50)
-        at_76 = StressRecord(timestamp=ts, stress_level=76)
-
-        self.assertEqual(at_25.stress_category, "low")  # <= 25 is low
-        self.assertEqual(at_50.stress_category, "medium")  # <= 50 is medium
-        self.assertEqual(at_76.stress_category, "very_high")  # > 75
+        # Boundaries: <= 25 is low, <= 50 is medium, > 75 is very_high
+        cases = [(20, "low"), (25, "low"), (45, "medium"), (50, "medium"),
+                 (75, "high"), (76, "very_high")]
+        for level, expected in cases:
+            with self.subTest(level=level):
+                record = StressRecord(timestamp=ts, stress_level=level)
+                self.assertEqual(record.stress_category, expected)
 
 
 class TestActivityRecord(unittest.TestCase):
@@ -144,27 +206,17 @@ class TestActivityRecord(unittest.TestCase):
 
     def test_pace_per_km_edge_cases(self):
         """Test pace_per_km with edge case values."""
-        # Test with distance=0
-        record_zero = ActivityRecord(
-            activity_id="123",
-            name="Test",
-            sport="running",
-            start_time=datetime(2025, 1, 15, 7, 0),
-            duration=timedelta(minutes=30),
-            distance=0,
-        )
-        self.assertIsNone(record_zero.pace_per_km)
-
-        # Test with distance=None
-        record_none = ActivityRecord(
-            activity_id="124",
-            name="Test",
-            sport="running",
-            start_time=datetime(2025, 1, 15, 7, 0),
-            duration=timedelta(minutes=30),
-            distance=None,
-        )
-        self.assertIsNone(record_none.pace_per_km)
+        for distance in (0, None):
+            with self.subTest(distance=distance):
+                record = ActivityRecord(
+                    activity_id="123",
+                    name="Test",
+                    sport="running",
+                    start_time=datetime(2025, 1, 15, 7, 0),
+                    duration=timedelta(minutes=30),
+                    distance=distance,
+                )
+                self.assertIsNone(record.pace_per_km)
 
 
 class TestBodyBatteryRecord(unittest.TestCase):
@@ -204,5 +256,69 @@ class TestDailySummaryRecord(unittest.TestCase):
         self.assertEqual(record.stress_avg, 28)
 
 
+class TestPositionalFactories(unittest.TestCase):
+    """Test generated positional constructors."""
+
+    def test_factories_match_dataclass_init(self):
+        """Test factories build records equal to the dataclass constructor."""
+        ts = datetime(2025, 1, 15, 10, 0)
+        self.assertEqual(make_stress_record(ts, 35), StressRecord(timestamp=ts, stress_level=35))
+        self.assertEqual(
+            make_heart_rate_record(ts, 60, None), HeartRateRecord(timestamp=ts, heart_rate=60)
+        )
+
+        sleep = make_sleep_record(
+            date(2025, 1, 15), timedelta(hours=8), timedelta(hours=2), timedelta(hours=4),
+            timedelta(hours=1), timedelta(minutes=30), 80, None, None
+        )
+        self.assertEqual(sleep, SleepRecord(
+            date=date(2025, 1, 15),
+            total_sleep=timedelta(hours=8),
+            deep_sleep=timedelta(hours=2),
+            light_sleep=timedelta(hours=4),
+            rem_sleep=timedelta(hours=1),
+            awake_time=timedelta(minutes=30),
+            sleep_score=80,
+        ))
+        # __post_init__ still runs
+        self.assertAlmostEqual(sleep.deep_sleep_percent, 25.0)
+
+
+class TestRecordLayout(unittest.TestCase):
+    """Test all DTOs are slotted and immutable."""
+
+    def test_records_are_slotted_and_frozen(self):
+        """Test records have no __dict__ and reject attribute writes."""
+        from dataclasses import FrozenInstanceError
+
+        records = [
+            SleepRecord(
+                date=date(2025, 1, 15),
+                total_sleep=timedelta(hours=7),
+                deep_sleep=timedelta(hours=1),
+                light_sleep=timedelta(hours=4),
+                rem_sleep=timedelta(hours=2),
+                awake_time=timedelta(0),
+            ),
+            HeartRateRecord(timestamp=datetime(2025, 1, 15, 10, 0), heart_rate=60),
+            StressRecord(timestamp=datetime(2025, 1, 15, 10, 0), stress_level=35),
+            BodyBatteryRecord(timestamp=datetime(2025, 1, 15, 10, 0), level=80),
+            ActivityRecord(
+                activity_id="1",
+                name="Run",
+                sport="running",
+                start_time=datetime(2025, 1, 15, 10, 0),
+                duration=timedelta(minutes=30),
+            ),
+            DailySummaryRecord(date=date(2025, 1, 15)),
+        ]
+
+        for record in records:
+            with self.subTest(record=type(record).__name__):
+                self.assertFalse(hasattr(record, "__dict__"))
+                with self.assertRaises(FrozenInstanceError):
+                    setattr(record, type(record).__slots__[0], None)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,12 @@
 """Tests for main HealthAnalyzer entry point."""
 
 import unittest
-from datetime import date, timedelta
+from datetime import timedelta
+
+from garmindb.data.repositories import SQLiteHealthRepository
+from garmindb.analysis import HealthAnalyzer, HealthReport
+
+from seeded_db import TODAY, seeded_db_params
 
 
 class TestHealthAnalyzer(unittest.TestCase):
@@ -9,27 +14,29 @@ class TestHealthAnalyzer(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up repository for tests."""
-        from garmindb import GarminConnectConfigManager
-        from garmindb.data.repositories import SQLiteHealthRepository
-
-        gc_config = GarminConnectConfigManager()
-        db_params = gc_config.get_db_params()
+        """Set up repository, analyzer and shared reports for tests."""
+        db_params, cls.cleanup_db = seeded_db_params()
         cls.repository = SQLiteHealthRepository(db_params)
+        cls.analyzer = HealthAnalyzer(cls.repository)
+
+        # Tests only read these reports, so generate each one once
+        cls.weekly = cls.analyzer.weekly_report(TODAY)
+        cls.daily = cls.analyzer.daily_report(TODAY)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the repository and remove the seeded database."""
+        cls.repository.close()
+        cls.cleanup_db()
 
     def test_analyzer_instantiation(self):
         """Test creating HealthAnalyzer."""
-        from garmindb.analysis import HealthAnalyzer
-
         analyzer = HealthAnalyzer(self.repository)
         self.assertIsNotNone(analyzer)
 
     def test_weekly_report(self):
         """Test generating weekly report."""
-        from garmindb.analysis import HealthAnalyzer, HealthReport
-
-        analyzer = HealthAnalyzer(self.repository)
-        report = analyzer.weekly_report()
+        report = self.weekly
 
         self.assertIsInstance(report, HealthReport)
         self.assertIsNotNone(report.generated_at)
@@ -38,22 +45,16 @@ class TestHealthAnalyzer(unittest.TestCase):
 
     def test_daily_report(self):
         """Test generating daily report."""
-        from garmindb.analysis import HealthAnalyzer, HealthReport
-
-        analyzer = HealthAnalyzer(self.repository)
-        report = analyzer.daily_report()
+        report = self.daily
 
         self.assertIsInstance(report, HealthReport)
 
     def test_custom_period_report(self):
         """Test generating report for custom period."""
-        from garmindb.analysis import HealthAnalyzer, HealthReport
-
-        analyzer = HealthAnalyzer(self.repository)
-        end_date = date.today()
+        end_date = TODAY
         start_date = end_date - timedelta(days=30)
 
-        report = analyzer.generate_report(start_date, end_date)
+        report = self.analyzer.generate_report(start_date, end_date)
 
         self.assertIsInstance(report, HealthReport)
         self.assertEqual(report.period_start, start_date)
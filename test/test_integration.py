@@ -11,39 +11,41 @@ class TestFullReportGeneration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up for integration tests."""
-        from garmindb import GarminConnectConfigManager
         from garmindb.data.repositories import SQLiteHealthRepository
         from garmindb.analysis import HealthAnalyzer
         from garmindb.presentation import MarkdownPresenter
+        from seeded_db import TODAY, seeded_db_params
 
-        gc_config = GarminConnectConfigManager()
-        db_params = gc_config.get_db_params()
+        db_params, cls.cleanup_db = seeded_db_params()
 
         cls.repository = SQLiteHealthRepository(db_params)
         cls.analyzer = HealthAnalyzer(cls.repository)
         cls.presenter = MarkdownPresenter()
 
+        # Tests only read these, so generate and render each report once
+        cls.weekly_report = cls.analyzer.weekly_report(TODAY)
+        cls.weekly_markdown = cls.presenter.render_report(cls.weekly_report)
+        cls.monthly_report = cls.analyzer.monthly_report(TODAY)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the repository and remove the seeded database."""
+        cls.repository.close()
+        cls.cleanup_db()
+
     def test_full_weekly_report_flow(self):
         """Test generating and rendering a weekly report."""
-        # Generate report
-        report = self.analyzer.weekly_report()
+        markdown = self.weekly_markdown
 
-        # Render to markdown
-        markdown = self.presenter.render_report(report)
-
-        # Validate output
+        # Validate output, metadata ("---") and table structure
         self.assertIsInstance(markdown, str)
-        self.assertIn("Health Report", markdown)
-        self.assertIn("Sleep Analysis", markdown)
-
-        # Check structure
-        self.assertIn("---", markdown)  # Has metadata
-        self.assertIn("| Metric |", markdown)  # Has table
+        needles = ("Health Report", "Sleep Analysis", "---", "| Metric |")
+        missing = [needle for needle in needles if needle not in markdown]
+        self.assertFalse(missing, f"missing {missing}")
 
     def test_report_can_be_saved_to_file(self):
         """Test that report can be written to file."""
-        report = self.analyzer.weekly_report()
-        markdown = self.presenter.render_report(report)
+        markdown = self.weekly_markdown
 
         with tempfile.NamedTemporaryFile(
             mode='w', suffix='.md', delete=False
@@ -61,8 +63,8 @@ class TestFullReportGeneration(unittest.TestCase):
 
     def test_monthly_report_has_more_data(self):
         """Test that monthly report covers more data than weekly."""
-        weekly = self.analyzer.weekly_report()
-        monthly = self.analyzer.monthly_report()
+        weekly = self.weekly_report
+        monthly = self.monthly_report
 
         weekly_days = (weekly.period_end - weekly.period_start).days
         monthly_days = (monthly.period_end - monthly.period_start).days
@@ -71,14 +73,13 @@ class TestFullReportGeneration(unittest.TestCase):
 
     def test_report_metadata_is_llm_friendly(self):
         """Test that report has LLM-friendly YAML frontmatter."""
-        report = self.analyzer.weekly_report()
-        markdown = self.presenter.render_report(report)
+        markdown = self.weekly_markdown
 
         # Check YAML frontmatter structure
         self.assertTrue(markdown.startswith("---"))
-        self.assertIn("report_type: health_analysis", markdown)
-        self.assertIn("data_source: garmin_connect", markdown)
-        self.assertIn("format_version:", markdown)
+        needles = ("report_type: health_analysis", "data_source: garmin_connect", "format_version:")
+        missing = [needle for needle in needles if needle not in markdown]
+        self.assertFalse(missing, f"missing {missing}")
 
 
 if __name__ == "__main__":
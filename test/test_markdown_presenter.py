@@ -1,35 +1,35 @@
 """Tests for Markdown presenter."""
 
-import os
-import sys
 import unittest
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 
-# Add paths to avoid loading heavy garmindb dependencies
-# We import directly from the module files rather than through __init__.py
-_base = os.path.dirname(__file__)
-_project_root = os.path.abspath(os.path.join(_base, '..'))
-
-# Add paths for direct module imports (bypasses __init__.py chains)
-sys.path.insert(0, os.path.join(_project_root, 'garmindb', 'analysis'))
-sys.path.insert(0, os.path.join(_project_root, 'garmindb', 'presentation'))
-
-from models import (  # noqa: E402
+from garmindb.analysis.models import (
+    ActivityAnalysisResult,
     SleepAnalysisResult,
+    SportSummary,
     MetricSummary,
     TrendDirection,
     Insight,
     InsightSeverity,
+    HealthReport,
+)
+from garmindb.presentation import Presenter, MarkdownPresenter
+from garmindb.presentation.markdown.renderer import (
+    _acwr_risk_label,
+    _progress_bar,
+    _tsb_form_label,
+    render_report,
 )
-
-# Import base directly to avoid relative import issues
-from base import Presenter  # noqa: E402
-from markdown.renderer import MarkdownPresenter  # noqa: E402
 
 
 class TestMarkdownPresenter(unittest.TestCase):
     """Test MarkdownPresenter implementation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one default presenter shared by the rendering tests."""
+        cls.presenter = MarkdownPresenter()
+
     def test_presenter_instantiation(self):
         """Test creating MarkdownPresenter."""
         presenter = MarkdownPresenter()
@@ -40,10 +40,24 @@ class TestMarkdownPresenter(unittest.TestCase):
         presenter = MarkdownPresenter()
         self.assertIsInstance(presenter, Presenter)
 
+    def test_presenter_has_no_instance_dict(self):
+        """Test MarkdownPresenter stores its state in slots."""
+        presenter = MarkdownPresenter(include_metadata=False)
+        self.assertFalse(hasattr(presenter, "__dict__"))
+        self.assertFalse(presenter.include_metadata)
+
+    def test_base_presenter_requires_overrides(self):
+        """Test a Presenter missing a render method cannot be instantiated."""
+
+        class SleepOnlyPresenter(Presenter):
+            def render_sleep(self, result):
+                return ""
+
+        with self.assertRaises(TypeError):
+            SleepOnlyPresenter()
+
     def test_render_sleep_analysis(self):
         """Test rendering SleepAnalysisResult as markdown."""
-        presenter = MarkdownPresenter()
-
         result = SleepAnalysisResult(
             period_start=date(2025, 1, 1),
             period_end=date(2025, 1, 7),
@@ -71,7 +85,7 @@ class TestMarkdownPresenter(unittest.TestCase):
             sleep_consistency_score=75.0,
         )
 
-        markdown = presenter.render_sleep(result)
+        markdown = self.presenter.render_sleep(result)
 
         self.assertIn("## Sleep Analysis", markdown)
         self.assertIn("7.5", markdown)
@@ -79,8 +93,6 @@ class TestMarkdownPresenter(unittest.TestCase):
 
     def test_render_includes_insights(self):
         """Test that insights are rendered."""
-        presenter = MarkdownPresenter()
-
         result = SleepAnalysisResult(
             period_start=date(2025, 1, 1),
             period_end=date(2025, 1, 7),
@@ -103,11 +115,129 @@ class TestMarkdownPresenter(unittest.TestCase):
             ],
         )
 
-        markdown = presenter.render_sleep(result)
+        markdown = self.presenter.render_sleep(result)
 
         self.assertIn("Sleep Debt Detected", markdown)
         self.assertIn("Go to bed earlier", markdown)
 
+    def test_progress_bar_clamps_percent(self):
+        """Test progress bars stay within their width."""
+        self.assertEqual(_progress_bar(0), "[          ]")
+        self.assertEqual(_progress_bar(45.5), "[====      ]")
+        self.assertEqual(_progress_bar(100), "[==========]")
+        self.assertEqual(_progress_bar(130), "[==========]")
+        self.assertEqual(_progress_bar(-5), "[          ]")
+        self.assertEqual(_progress_bar(50, width=4), "[==  ]")
+
+    def test_label_thresholds(self):
+        """Test TSB and ACWR labels at their boundaries."""
+        tsb_cases = [(26, "peak form"), (25, "fresh"), (5.5, "fresh"), (5, "neutral"),
+                     (-10, "neutral"), (-10.5, "tired"), (-30, "tired"), (-31, "fatigued")]
+        for tsb, label in tsb_cases:
+            self.assertEqual(_tsb_form_label(tsb), label, tsb)
+
+        acwr_cases = [(0.79, "undertrained"), (0.8, "optimal zone"), (1.3, "optimal zone"),
+                      (1.31, "elevated risk"), (1.5, "elevated risk"), (1.51, "high injury risk")]
+        for acwr, label in acwr_cases:
+            self.assertEqual(_acwr_risk_label(acwr), label, acwr)
+
+    def test_report_timestamp_respects_utc_offset(self):
+        """Test equal instants in different offsets render their own times."""
+        utc = datetime(2025, 1, 8, 12, 0, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+
+        for generated_at, shown in ((utc, "2025-01-08 12:00"), (cet, "2025-01-08 13:00")):
+            report = HealthReport(
+                generated_at=generated_at,
+                period_start=date(2025, 1, 1),
+                period_end=date(2025, 1, 7),
+            )
+            markdown = self.presenter.render_report(report)
+            self.assertIn(f"*Generated: {shown}*", markdown)
+            self.assertIn(f"generated: {generated_at.isoformat()}", markdown)
+
+    def test_render_empty_report(self):
+        """Test a report without sections renders a no-data note."""
+        report = HealthReport(
+            generated_at=datetime(2025, 1, 8, 12, 0),
+            period_start=date(2025, 1, 1),
+            period_end=date(2025, 1, 7),
+        )
+
+        markdown = MarkdownPresenter(include_metadata=False).render_report(report)
+
+        self.assertEqual(markdown, (
+            "# Health Report: 2025-01-01 to 2025-01-07\n\n"
+            "\n*Generated: 2025-01-08 12:00*\n\n\n"
+            "*No data available for this period.*"
+        ))
+        self.assertTrue(
+            MarkdownPresenter().render_report(report).startswith("---\n")
+        )
+        self.assertEqual(render_report(report, include_metadata=False), markdown)
+
+    def test_iter_render_report_matches_render_report(self):
+        """Test streamed chunks concatenate to the rendered report."""
+        report = HealthReport(
+            generated_at=datetime(2025, 1, 8, 12, 0),
+            period_start=date(2025, 1, 1),
+            period_end=date(2025, 1, 7),
+            key_insights=[
+                Insight(
+                    title="Rest More",
+                    description="Recovery is trending down.",
+                    severity=InsightSeverity.INFO,
+                    category="recovery",
+                )
+            ],
+        )
+
+        chunks = list(self.presenter.iter_render_report(report))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), self.presenter.render_report(report))
+        self.assertIn("## Key Insights", chunks[-1])
+
+    def test_sport_table_sorted_by_name(self):
+        """Test the By Sport table lists sports by name whatever the insertion order."""
+        report = HealthReport(
+            generated_at=datetime(2025, 1, 8, 12, 0),
+            period_start=date(2025, 1, 1),
+            period_end=date(2025, 1, 7),
+            activities=ActivityAnalysisResult(
+                period_start=date(2025, 1, 1),
+                period_end=date(2025, 1, 7),
+                total_activities=3,
+                total_duration_hours=3.0,
+                total_distance_km=40.0,
+                total_calories=1500,
+                sport_summaries={
+                    name: SportSummary(name, 1, 10.0, 1.0)
+                    for name in ("swimming", "cycling", "running")
+                },
+            ),
+        )
+
+        markdown = self.presenter.render_report(report)
+
+        positions = [markdown.index(f"| {name} |") for name in ("cycling", "running", "swimming")]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_render_report_respects_include_metadata(self):
+        """Test toggling include_metadata on a presenter changes its output."""
+        report = HealthReport(
+            generated_at=datetime(2025, 1, 8, 12, 0),
+            period_start=date(2025, 1, 1),
+            period_end=date(2025, 1, 7),
+        )
+        presenter = MarkdownPresenter()
+
+        self.assertTrue(presenter.render_report(report).startswith("---\n"))
+        presenter.include_metadata = False
+        self.assertFalse(presenter.render_report(report).startswith("---\n"))
+        presenter.include_metadata = True
+        self.assertTrue(presenter.render_report(report).startswith("---\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
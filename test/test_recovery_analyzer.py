@@ -3,64 +3,79 @@
 import unittest
 from datetime import date, timedelta
 
+from garmindb.data.repositories import SQLiteHealthRepository
+from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
+from garmindb.analysis.models import (
+    DailyReadinessResult,
+    Insight,
+    RecoveryAnalysisResult,
+)
+
+from seeded_db import TODAY, seeded_db_params
+
+
+# Seeded database and 30-day analysis shared by every test class
+_shared = {}
+
+
+def _seeded():
+    """Seed the database and run the 30-day analysis on first use.
+
+    Returns:
+        (repository, 30-day RecoveryAnalysisResult)
+    """
+    if not _shared:
+        db_params, _shared['cleanup'] = seeded_db_params()
+        _shared['repository'] = SQLiteHealthRepository(db_params)
+        _shared['result_30d'] = RecoveryAnalyzer(_shared['repository']).analyze(TODAY - timedelta(days=30), TODAY)
+    return _shared['repository'], _shared['result_30d']
+
+
+def tearDownModule():
+    """Remove the seeded database, if a test class seeded it."""
+    if _shared:
+        _shared['repository'].close()
+        _shared.pop('cleanup')()
+        _shared.clear()
+
 
 class TestRecoveryAnalyzer(unittest.TestCase):
     """Test RecoveryAnalyzer implementation."""
 
     @classmethod
     def setUpClass(cls):
-        """Set up repository for tests."""
-        from garmindb import GarminConnectConfigManager
-        from garmindb.data.repositories import SQLiteHealthRepository
+        """Set up analyzer and shared analysis results for tests."""
+        cls.repository, cls.result_30d = _seeded()
+        cls.analyzer = RecoveryAnalyzer(cls.repository)
 
-        gc_config = GarminConnectConfigManager()
-        db_params = gc_config.get_db_params()
-        cls.repository = SQLiteHealthRepository(db_params)
+        # Tests only read these results, so analyze each range once
+        cls.end_date = TODAY
+        cls.start_7d = cls.end_date - timedelta(days=7)
+        cls.result_7d = cls.analyzer.analyze(cls.start_7d, cls.end_date)
 
     def test_analyzer_instantiation(self):
         """Test creating RecoveryAnalyzer."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
         analyzer = RecoveryAnalyzer(self.repository)
         self.assertIsNotNone(analyzer)
 
     def test_analyze_returns_result(self):
         """Test analyze returns RecoveryAnalysisResult."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-        from garmindb.analysis.models import RecoveryAnalysisResult
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=7)
-
-        result = analyzer.analyze(start_date, end_date)
+        result = self.result_7d
 
         self.assertIsInstance(result, RecoveryAnalysisResult)
-        self.assertEqual(result.period_start, start_date)
-        self.assertEqual(result.period_end, end_date)
+        self.assertEqual(result.period_start, self.start_7d)
+        self.assertEqual(result.period_end, self.end_date)
 
     def test_analyze_recovery_score_range(self):
         """Test that recovery score is in valid range 0-100."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        result = analyzer.analyze(start_date, end_date)
+        result = self.result_30d
 
         self.assertGreaterEqual(result.recovery_score, 0)
         self.assertLessEqual(result.recovery_score, 100)
 
     def test_analyze_generates_metric_summaries(self):
         """Test that analyze generates metric summaries."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        result = analyzer.analyze(start_date, end_date)
+        result = self.result_30d
 
         self.assertIsNotNone(result.rhr_summary)
         self.assertIsNotNone(result.body_battery_summary)
@@ -68,25 +83,18 @@ class TestRecoveryAnalyzer(unittest.TestCase):
 
     def test_daily_readiness_returns_result(self):
         """Test daily_readiness returns DailyReadinessResult."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-        from garmindb.analysis.models import DailyReadinessResult
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        target_date = date.today()
+        target_date = TODAY
 
-        result = analyzer.daily_readiness(target_date)
+        result = self.analyzer.daily_readiness(target_date)
 
         self.assertIsInstance(result, DailyReadinessResult)
         self.assertEqual(result.analysis_date, target_date)
 
     def test_daily_readiness_score_range(self):
         """Test daily readiness scores are in valid range."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        target_date = date.today()
+        target_date = TODAY
 
-        result = analyzer.daily_readiness(target_date)
+        result = self.analyzer.daily_readiness(target_date)
 
         self.assertGreaterEqual(result.recovery_score, 0)
         self.assertLessEqual(result.recovery_score, 100)
@@ -95,13 +103,10 @@ class TestRecoveryAnalyzer(unittest.TestCase):
 
     def test_empty_period_returns_default_result(self):
         """Test analysis of period with no data."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
         start_date = date(2099, 1, 1)
         end_date = date(2099, 1, 7)
 
-        result = analyzer.analyze(start_date, end_date)
+        result = self.analyzer.analyze(start_date, end_date)
 
         self.assertEqual(result.period_start, start_date)
         self.assertEqual(result.period_end, end_date)
@@ -110,13 +115,7 @@ class TestRecoveryAnalyzer(unittest.TestCase):
 
     def test_acwr_calculation(self):
         """Test ACWR is calculated when sufficient data."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        result = analyzer.analyze(start_date, end_date)
+        result = self.result_30d
 
         # ACWR is optional - may be None if no activities or 0 if no recent activities
         if result.acute_chronic_ratio is not None:
@@ -128,38 +127,16 @@ class TestRecoveryAnalyzerInsights(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up repository for tests."""
-        from garmindb import GarminConnectConfigManager
-        from garmindb.data.repositories import SQLiteHealthRepository
-
-        gc_config = GarminConnectConfigManager()
-        db_params = gc_config.get_db_params()
-        cls.repository = SQLiteHealthRepository(db_params)
+        """Reuse the module's 30-day analysis for insight checks."""
+        _, cls.result_30d = _seeded()
 
     def test_insights_list_exists(self):
         """Test insights list is created."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        result = analyzer.analyze(start_date, end_date)
-
-        self.assertIsInstance(result.insights, list)
+        self.assertIsInstance(self.result_30d.insights, list)
 
     def test_insights_have_required_fields(self):
         """Test all insights have required fields."""
-        from garmindb.analysis.recovery_analyzer import RecoveryAnalyzer
-        from garmindb.analysis.models import Insight
-
-        analyzer = RecoveryAnalyzer(self.repository)
-        end_date = date.today()
-        start_date = end_date - timedelta(days=30)
-
-        result = analyzer.analyze(start_date, end_date)
-
-        for insight in result.insights:
+        for insight in self.result_30d.insights:
             self.assertIsInstance(insight, Insight)
             self.assertTrue(insight.title)
             self.assertTrue(insight.description)
@@ -4,16 +4,18 @@ Note: These tests import directly from the repositories module to avoid
 loading the heavy dependencies in garmindb/__init__.py (like fitfile).
 """
 
+import importlib.util
 import os
-import sys
 import unittest
 
-# Add the garmindb/data directory to path to import repositories directly
-# This avoids triggering garmindb/__init__.py which has heavy dependencies
-_data_path = os.path.join(os.path.dirname(__file__), '..', 'garmindb', 'data')
-sys.path.insert(0, os.path.abspath(_data_path))
+# Load garmindb/data/repositories/base.py on its own, without triggering the
+# heavy dependencies in garmindb/__init__.py and without growing sys.path
+_base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'garmindb', 'data', 'repositories', 'base.py')
+_spec = importlib.util.spec_from_file_location('garmindb_repositories_base', _base_path)
+_base = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_base)
 
-from repositories.base import HealthRepository  # noqa: E402
+HealthRepository = _base.HealthRepository
 
 
 class TestHealthRepositoryInterface(unittest.TestCase):
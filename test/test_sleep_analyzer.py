@@ -3,19 +3,27 @@
 import unittest
 from datetime import date, timedelta
 
+from _config import requires_db
 
+
+@requires_db
 class TestSleepAnalyzer(unittest.TestCase):
     """Test SleepAnalyzer implementation."""
 
     @classmethod
     def setUpClass(cls):
         """Set up repository for tests."""
-        from garmindb import GarminConnectConfigManager
         from garmindb.data.repositories import SQLiteHealthRepository
+        from _config import db_available, db_params
+
+        if not db_available():
+            raise unittest.SkipTest("Garmin databases not available")
+        cls.repository = SQLiteHealthRepository(db_params())
 
-        gc_config = GarminConnectConfigManager()
-        db_params = gc_config.get_db_params()
-        cls.repository = SQLiteHealthRepository(db_params)
+    @classmethod
+    def tearDownClass(cls):
+        """Close the repository's databases."""
+        cls.repository.close()
 
     def test_analyzer_instantiation(self):
         """Test creating SleepAnalyzer."""
@@ -5,46 +5,61 @@ __copyright__ = "Copyright Tom Goetz"
 __license__ = "GPL"
 
 import unittest
-from datetime import date, timedelta
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
 
+from sqlalchemy import event, text
 
+from garmindb.data.models import (
+    ActivityRecord, BodyBatteryRecord, DailySummaryRecord, HeartRateRecord, HeartRateSeries, SleepRecord,
+    StressRecord
+)
+from garmindb.data.repositories import HealthRepository, SQLiteHealthRepository
+from garmindb.garmindb import Activities, DailySummary, MonitoringHeartRate, RestingHeartRate, Sleep, Stress
+from garmindb.summarydb import DaysSummary
+
+from _config import db_available, db_params, requires_db
+from seeded_db import seeded_db_params
+
+
+@requires_db
 class TestSQLiteHealthRepository(unittest.TestCase):
-    """Test SQLiteHealthRepository implementation."""
+    """Test SQLiteHealthRepository implementation.
+
+    Read-only tests share ``cls.repo`` and its opened databases; tests that
+    mutate or patch a repository build their own instance.
+    """
 
     @classmethod
     def setUpClass(cls):
         """Set up test database connection."""
-        from garmindb import GarminConnectConfigManager
+        if not db_available():
+            raise unittest.SkipTest("Garmin databases not available")
+        cls.db_params = db_params()
+        cls.repo = SQLiteHealthRepository(cls.db_params)
 
-        gc_config = GarminConnectConfigManager()
-        cls.db_params = gc_config.get_db_params()
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared repository's databases."""
+        cls.repo.close()
 
     def test_repository_instantiation(self):
         """Test creating SQLiteHealthRepository."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-
         repo = SQLiteHealthRepository(self.db_params)
         self.assertIsNotNone(repo)
 
     def test_implements_interface(self):
         """Test that SQLiteHealthRepository implements HealthRepository."""
-        from garmindb.data.repositories import (
-            SQLiteHealthRepository, HealthRepository
-        )
-
         repo = SQLiteHealthRepository(self.db_params)
         self.assertIsInstance(repo, HealthRepository)
 
     def test_get_sleep_data_returns_list(self):
         """Test get_sleep_data returns list of SleepRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import SleepRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=7)
 
-        result = repo.get_sleep_data(start_date, end_date)
+        result = self.repo.get_sleep_data(start_date, end_date)
 
         self.assertIsInstance(result, list)
         if result:
@@ -52,14 +67,10 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_get_daily_summaries_returns_list(self):
         """Test get_daily_summaries returns list of DailySummaryRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import DailySummaryRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=7)
 
-        result = repo.get_daily_summaries(start_date, end_date)
+        result = self.repo.get_daily_summaries(start_date, end_date)
 
         self.assertIsInstance(result, list)
         if result:
@@ -67,14 +78,10 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_get_activities_returns_list(self):
         """Test get_activities returns list of ActivityRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import ActivityRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=30)
 
-        result = repo.get_activities(start_date, end_date)
+        result = self.repo.get_activities(start_date, end_date)
 
         self.assertIsInstance(result, list)
         if result:
@@ -82,14 +89,10 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_get_heart_rate_data_returns_list(self):
         """Test get_heart_rate_data returns list of HeartRateRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import HeartRateRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=7)
 
-        result = repo.get_heart_rate_data(
+        result = self.repo.get_heart_rate_data(
             start_date, end_date, resting_only=True
         )
 
@@ -97,16 +100,37 @@ class TestSQLiteHealthRepository(unittest.TestCase):
         if result:
             self.assertIsInstance(result[0], HeartRateRecord)
 
+    def test_get_heart_rate_arrays_matches_records(self):
+        """Test get_heart_rate_arrays returns the same samples as records."""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=7)
+
+        for resting_only in (True, False):
+            series = self.repo.get_heart_rate_arrays(start_date, end_date, resting_only=resting_only)
+            records = self.repo.get_heart_rate_data(start_date, end_date, resting_only=resting_only)
+
+            self.assertIsInstance(series, HeartRateSeries)
+            self.assertEqual(list(series.timestamps), [r.timestamp for r in records])
+            self.assertEqual(list(series.heart_rates), [r.heart_rate for r in records])
+
+    def test_iter_heart_rate_data_matches_list(self):
+        """Test streamed heart rate records match the list getter."""
+        end_date = date.today()
+        start_date = end_date - timedelta(days=7)
+
+        for resting_only in (True, False):
+            streamed = self.repo.iter_heart_rate_data(start_date, end_date, resting_only=resting_only, batch_size=10)
+            self.assertEqual(
+                list(streamed),
+                self.repo.get_heart_rate_data(start_date, end_date, resting_only=resting_only)
+            )
+
     def test_get_stress_data_returns_list(self):
         """Test get_stress_data returns list of StressRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import StressRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=7)
 
-        result = repo.get_stress_data(start_date, end_date)
+        result = self.repo.get_stress_data(start_date, end_date)
 
         self.assertIsInstance(result, list)
         if result:
@@ -114,14 +138,10 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_get_body_battery_data_returns_list(self):
         """Test get_body_battery_data returns list of BodyBatteryRecords."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-        from garmindb.data.models import BodyBatteryRecord
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=7)
 
-        result = repo.get_body_battery_data(start_date, end_date)
+        result = self.repo.get_body_battery_data(start_date, end_date)
 
         self.assertIsInstance(result, list)
         if result:
@@ -129,8 +149,6 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_lazy_loading_databases(self):
         """Test that database connections are lazy-loaded."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-
         repo = SQLiteHealthRepository(self.db_params)
 
         # Before accessing any data, internal db refs should be None
@@ -145,15 +163,62 @@ class TestSQLiteHealthRepository(unittest.TestCase):
         _ = repo.get_sleep_data(start, end)
         self.assertIsNotNone(repo._garmin_db)
 
-    def test_sleep_records_sorted_by_date(self):
-        """Test that sleep records are returned sorted by date."""
-        from garmindb.data.repositories import SQLiteHealthRepository
+    def test_repeated_range_is_served_from_cache(self):
+        """Test repeated getter calls reuse the first query's results."""
+        repo = SQLiteHealthRepository(self.db_params)
+
+        end_date = date.today()
+        start_date = end_date - timedelta(days=7)
+
+        with patch.object(repo, '_select_columns', wraps=repo._select_columns) as select:
+            first = repo.get_sleep_data(start_date, end_date)
+            second = repo.get_sleep_data(start_date, end_date)
+            self.assertEqual(select.call_count, 1)
+            self.assertEqual(first, second)
+            self.assertIsNot(first, second)
+
+            repo.get_sleep_data(start_date, end_date - timedelta(days=1))
+            self.assertEqual(select.call_count, 2)
+
+            repo.clear_cache()
+            repo.get_sleep_data(start_date, end_date)
+            self.assertEqual(select.call_count, 3)
 
+    def test_daily_summary_keeps_zero_floors(self):
+        """Test a day with zero floors climbed is not reported as missing."""
         repo = SQLiteHealthRepository(self.db_params)
+
+        Row = namedtuple('Row', [
+            'day', 'rhr_avg', 'stress_avg', 'bb_max', 'bb_min', 'bb_charged', 'steps', 'floors',
+            'activities_distance', 'calories_active_avg', 'calories_avg', 'sleep_avg', 'intensity_time'
+        ])
+        rows = [
+            Row(date(2025, 1, 1), 52.4, 30, 90, 20, 60, 8000, 0.0, 5.0, 400, 2200, None, None),
+            Row(date(2025, 1, 2), None, 30, 90, 20, 60, 8000, None, 5.0, 400, 2200, None, None),
+        ]
+
+        repo._summary_db = object()
+        with patch.object(repo, '_select_columns', return_value=rows):
+            records = repo.get_daily_summaries(date(2025, 1, 1), date(2025, 1, 2))
+
+        self.assertEqual([r.floors for r in records], [0, None])
+        self.assertEqual([r.resting_hr for r in records], [52, None])
+
+    def test_connections_use_read_pragmas(self):
+        """Test SQLite connections are opened with the read tuning pragmas."""
+        engine = self.repo.garmin_db.engine
+        if engine.dialect.name != 'sqlite':
+            self.skipTest("read pragmas only apply to SQLite")
+        with engine.connect() as conn:
+            self.assertEqual(conn.execute(text("PRAGMA cache_size")).scalar(), -65536)
+            self.assertEqual(conn.execute(text("PRAGMA temp_store")).scalar(), 2)
+
+    def test_sleep_records_sorted_by_date(self):
+        """Test that sleep records are returned sorted by date."""
         end_date = date.today()
         start_date = end_date - timedelta(days=30)
 
-        result = repo.get_sleep_data(start_date, end_date)
+        result = self.repo.get_sleep_data(start_date, end_date)
 
         if len(result) > 1:
             for i in range(len(result) - 1):
@@ -161,13 +226,10 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_activities_sorted_by_start_time(self):
         """Test that activities are returned sorted by start_time."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=90)
 
-        result = repo.get_activities(start_date, end_date)
+        result = self.repo.get_activities(start_date, end_date)
 
         if len(result) > 1:
             for i in range(len(result) - 1):
@@ -177,25 +239,188 @@ class TestSQLiteHealthRepository(unittest.TestCase):
 
     def test_activities_sport_filter(self):
         """Test that activities can be filtered by sport."""
-        from garmindb.data.repositories import SQLiteHealthRepository
-
-        repo = SQLiteHealthRepository(self.db_params)
         end_date = date.today()
         start_date = end_date - timedelta(days=365)
 
         # Get all activities
-        all_activities = repo.get_activities(start_date, end_date)
+        all_activities = self.repo.get_activities(start_date, end_date)
 
         # If there are activities, try filtering
         if all_activities:
             # Find a sport that exists
             sport = all_activities[0].sport
-            filtered = repo.get_activities(start_date, end_date, sport=sport)
+            filtered = self.repo.get_activities(start_date, end_date, sport=sport)
 
             # All filtered results should contain the sport
             for activity in filtered:
                 self.assertIn(sport.lower(), activity.sport.lower())
 
 
+class TestSQLiteHealthRepositoryQueries(unittest.TestCase):
+    """Test the repository's queries against a seeded database.
+
+    Tests that mutate or patch a repository build their own instance.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a repository on a seeded database."""
+        db_params, cls.cleanup_db = seeded_db_params()
+        cls.repo = SQLiteHealthRepository(db_params)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the repository and remove the seeded database."""
+        cls.repo.close()
+        cls.cleanup_db()
+
+    def query_plan(self, db, sql):
+        """Return the EXPLAIN QUERY PLAN details for sql as one string."""
+        with db.engine.connect() as conn:
+            return " | ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    def statement_plan(self, db, stmt):
+        """Return the EXPLAIN QUERY PLAN details for a SQLAlchemy statement."""
+        compiled = stmt.compile(dialect=db.engine.dialect)
+        params = tuple(str(compiled.params[name]) for name in compiled.positiontup)
+        with db.engine.connect() as conn:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+            return " | ".join(row[-1] for row in rows)
+
+    def test_period_queries_search_time_index(self):
+        """Test every getter's period query is an ordered, bounded index search."""
+        start_ts = self.repo._to_datetime(date(2026, 1, 1))
+        end_ts = self.repo._to_datetime_end(date(2026, 1, 15))
+        queries = (
+            (self.repo.garmin_db, Sleep, ('day', 'total_sleep'), None),
+            (self.repo.garmin_db, RestingHeartRate, ('day', 'resting_heart_rate'), 'resting_heart_rate'),
+            (self.repo.garmin_db, Stress, ('timestamp', 'stress'), 'stress'),
+            (self.repo.garmin_db, DailySummary, ('day', 'bb_max'), 'bb_max'),
+            (self.repo.activities_db, Activities, ('activity_id', 'start_time'), None),
+            (self.repo.monitoring_db, MonitoringHeartRate, ('timestamp', 'heart_rate'), None),
+            (self.repo.summary_db, DaysSummary, ('day', 'rhr_avg'), None),
+        )
+        for db, model, columns, not_none_col in queries:
+            with self.subTest(table=model.__tablename__):
+                stmt = self.repo._period_select(model, columns, start_ts, end_ts, not_none_col)
+                plan = self.statement_plan(db, stmt)
+                self.assertIn("SEARCH", plan)
+                self.assertNotIn("SCAN", plan)
+                # ORDER BY time_col is satisfied by the index walk, not a sort
+                self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_getter_query_plans_use_indexes(self):
+        """Test the SQL each getter actually issues is planned as an index search."""
+        start_date, end_date = date(2026, 1, 1), date(2026, 1, 15)
+        engines = {db.engine for db in (
+            self.repo.garmin_db, self.repo.activities_db, self.repo.monitoring_db, self.repo.summary_db
+        )}
+        getters = (
+            (self.repo.get_sleep_data, {}),
+            (self.repo.get_heart_rate_data, {'resting_only': True}),
+            (self.repo.get_heart_rate_data, {}),
+            (self.repo.get_stress_data, {}),
+            (self.repo.get_body_battery_data, {}),
+            (self.repo.get_activities, {'sport': 'run'}),
+            (self.repo.get_daily_summaries, {}),
+        )
+        for getter, kwargs in getters:
+            with self.subTest(getter=getter.__name__, **kwargs):
+                statements = []
+
+                def capture(conn, cursor, statement, parameters, context, executemany):
+                    statements.append((conn.engine, statement, parameters))
+
+                for engine in engines:
+                    event.listen(engine, "before_cursor_execute", capture)
+                try:
+                    self.repo.clear_cache()
+                    getter(start_date, end_date, **kwargs)
+                finally:
+                    for engine in engines:
+                        event.remove(engine, "before_cursor_execute", capture)
+
+                self.assertTrue(statements)
+                for engine, statement, parameters in statements:
+                    with engine.connect() as conn:
+                        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                    for row in rows:
+                        detail = row[-1]
+                        self.assertTrue(detail.startswith("SEARCH"), detail)
+                        self.assertRegex(detail, "USING (COVERING )?INDEX")
+
+    def test_resting_heart_rate_uses_partial_index(self):
+        """Test resting HR reads are covered by the partial index of days with a reading."""
+        stmt = self.repo._period_select(
+            RestingHeartRate, ('day', 'resting_heart_rate'),
+            datetime(2026, 1, 1), datetime(2026, 1, 16), 'resting_heart_rate'
+        )
+        plan = self.statement_plan(self.repo.garmin_db, stmt)
+        self.assertIn("USING COVERING INDEX idx_resting_hr_day", plan)
+
+    def test_period_end_is_next_midnight(self):
+        """Test period queries include the whole last day and nothing after it."""
+        self.assertEqual(self.repo._to_datetime_end(date(2026, 1, 15)), datetime(2026, 1, 16))
+
+    def test_activities_start_time_index(self):
+        """Test activities range reads use the start_time index declared on the model."""
+        plan = self.query_plan(
+            self.repo.activities_db,
+            "SELECT activity_id FROM activities WHERE start_time >= '2026-01-01' AND start_time < '2026-01-16'"
+        )
+        self.assertIn("USING INDEX idx_activities_start_time", plan)
+        self.assertNotIn("SCAN", plan)
+
+    def test_sport_filter_runs_in_query(self):
+        """Test the sport filter is a case-insensitive substring match done in SQL."""
+        start_date, end_date = date(2026, 1, 1), date(2026, 1, 15)
+        everything = self.repo.get_activities(start_date, end_date)
+
+        with patch.object(self.repo, '_select_columns', wraps=self.repo._select_columns) as select:
+            self.assertEqual(self.repo.get_activities(start_date, end_date, sport="RUN"), everything)
+            self.assertEqual(self.repo.get_activities(start_date, end_date, sport="cycl"), [])
+        self.assertIsNotNone(select.call_args.kwargs['where'])
+
+    def test_iter_stress_data_matches_list(self):
+        """Test streamed stress records match the list getter across batches."""
+        start_date, end_date = date(2026, 1, 1), date(2026, 1, 15)
+
+        streamed = list(self.repo.iter_stress_data(start_date, end_date, batch_size=10))
+
+        self.assertGreater(len(streamed), 10)
+        self.assertEqual(streamed, self.repo.get_stress_data(start_date, end_date))
+
+    def test_close_reopens_databases_on_next_use(self):
+        """Test a closed repository releases its databases and reopens them when read again."""
+        repo = SQLiteHealthRepository(self.repo.db_params)
+        self.addCleanup(repo.close)
+        day = date(2026, 1, 15)
+        before = repo.get_stress_data(day, day)
+
+        repo.close()
+
+        self.assertIsNone(repo._garmin_db)
+        self.assertEqual(repo.get_stress_data(day, day), before)
+
+    def test_query_cache_evicts_least_recently_used(self):
+        """Test a range read again survives eviction of an older one."""
+        repo = SQLiteHealthRepository(self.repo.db_params)
+        self.addCleanup(repo.close)
+        days = [date(2026, 1, day) for day in (10, 11, 12)]
+
+        with patch('garmindb.data.repositories.sqlite._QUERY_CACHE_SIZE', 2), \
+                patch.object(repo, '_select_columns', wraps=repo._select_columns) as select:
+            repo.get_sleep_data(days[0], days[0])
+            repo.get_sleep_data(days[1], days[1])
+            repo.get_sleep_data(days[0], days[0])
+            repo.get_sleep_data(days[2], days[2])
+            self.assertEqual(select.call_count, 3)
+
+            repo.get_sleep_data(days[0], days[0])
+            self.assertEqual(select.call_count, 3)
+            repo.get_sleep_data(days[1], days[1])
+            self.assertEqual(select.call_count, 4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,9 @@ from garmindb.analysis.stress_analyzer import StressAnalyzer
 from garmindb.data.models import StressRecord, ActivityRecord
 from garmindb.analysis.models import StressAnalysisResult, InsightSeverity
 
+# Fixed clock so tests never depend on the wall clock
+NOW = datetime(2026, 1, 15, 12, 0, 0)
+
 
 class TestStressAnalyzer(unittest.TestCase):
     """Test suite for StressAnalyzer logic."""
@@ -14,13 +17,11 @@ class TestStressAnalyzer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up repository for integration tests."""
-        from garmindb import GarminConnectConfigManager
         from garmindb.data.repositories import SQLiteHealthRepository
+        from _config import db_params
 
         try:
-            gc_config = GarminConnectConfigManager()
-            db_params = gc_config.get_db_params()
-            cls.repository = SQLiteHealthRepository(db_params)
+            cls.repository = SQLiteHealthRepository(db_params())
         except Exception:
             cls.repository = MagicMock()
 
@@ -71,6 +72,20 @@ class TestStressAnalyzer(unittest.TestCase):
         self.assertLess(result.total_load, 25.0)  # Should be around 20.3, NOT 320+
         self.assertEqual(result.period_minutes, 16) # 15 + 1
 
+    def test_total_load_matches_stress_load(self):
+        """Test the scalar load helper agrees with the full calculation."""
+        start = datetime(2026, 1, 1, 10, 0)
+        records = [
+            StressRecord(timestamp=start, stress_level=80),
+            StressRecord(timestamp=start + timedelta(minutes=3), stress_level=60),
+            StressRecord(timestamp=start + timedelta(hours=1), stress_level=20),
+        ]
+        full = self.analyzer._calculate_stress_load(
+            records, start, start + timedelta(hours=2)
+        )
+        self.assertEqual(self.analyzer._total_load(records), full.total_load)
+        self.assertEqual(self.analyzer._total_load([]), 0.0)
+
     def test_calculate_personal_baseline(self):
         """Test 25th percentile baseline calculation."""
         end_date = date(2026, 1, 1)
@@ -127,14 +142,26 @@ class TestStressAnalyzer(unittest.TestCase):
         patterns = self.analyzer._analyze_post_activity_recovery([activity], records, baseline)
         self.assertIsNone(patterns[0].recovery_time_minutes)
 
+    def test_sorted_by_timestamp(self):
+        """Test ordered input is reused and unordered input is sorted."""
+        start = datetime(2026, 1, 1, 10, 0)
+        ordered = [
+            StressRecord(timestamp=start + timedelta(minutes=i), stress_level=30)
+            for i in range(3)
+        ]
+        self.assertIs(self.analyzer._sorted_by_timestamp(ordered), ordered)
+
+        shuffled = [ordered[2], ordered[0], ordered[1]]
+        self.assertEqual(self.analyzer._sorted_by_timestamp(shuffled), ordered)
+
     def test_recovery_efficiency_score(self):
         """Test efficiency scoring logic."""
         from garmindb.analysis.models import PostActivityStressPattern
         
         # Pattern 1: 30 min recovery
-        p1 = PostActivityStressPattern("1", "run", datetime.now(), 15, 80, 20, 30)
+        p1 = PostActivityStressPattern("1", "run", NOW, 15, 80, 20, 30)
         # Pattern 2: No recovery (None)
-        p2 = PostActivityStressPattern("2", "run", datetime.now(), 15, 80, 20, None)
+        p2 = PostActivityStressPattern("2", "run", NOW, 15, 80, 20, None)
         
         # Avg = (30 + 120) / 2 = 75 min
         # Efficiency = 100 - (75 / 120) * 100 = 100 - 62.5 = 37.5
@@ -172,5 +199,33 @@ class TestStressAnalyzer(unittest.TestCase):
         self.assertEqual(result.avg_stress.current_value, 0.0)
         self.assertEqual(result.personal_baseline, 25.0)
 
+    def test_empty_period_skips_activity_lookup(self):
+        """Test analyze() short-circuits when the period has no stress data."""
+        self.mock_repo.get_stress_data.return_value = []
+
+        result = self.analyzer.analyze(date(2026, 1, 1), date(2026, 1, 7))
+        self.mock_repo.get_activities.assert_not_called()
+        self.assertEqual(len(result.hourly_patterns), 24)
+        self.assertEqual(result.stress_load.total_load, 0.0)
+        self.assertEqual(result.post_activity_patterns, [])
+
+    def test_analyze_daily_avg_stress(self):
+        """Test per-day averages skip empty days and invalid readings."""
+        day1 = datetime(2026, 1, 1, 10, 0)
+        day3 = datetime(2026, 1, 3, 10, 0)
+        self.mock_repo.get_stress_data.return_value = [
+            StressRecord(timestamp=day1, stress_level=20),
+            StressRecord(timestamp=day1 + timedelta(minutes=3), stress_level=40),
+            StressRecord(timestamp=day1 + timedelta(minutes=6), stress_level=-1),
+            StressRecord(timestamp=day3, stress_level=60),
+        ]
+        self.mock_repo.get_activities.return_value = []
+
+        result = self.analyzer.analyze(date(2026, 1, 1), date(2026, 1, 3))
+        self.assertEqual(result.daily_avg_stress, {
+            date(2026, 1, 1): 30.0,
+            date(2026, 1, 3): 60.0,
+        })
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,10 +9,11 @@ class _Row:
         self.weight = weight
 
 
-def test_get_weight_series_maps_and_sorts(monkeypatch, tmp_path):
+def test_get_weight_series_maps_in_db_order(monkeypatch, tmp_path):
     repo = SQLiteHealthRepository({"db_type": "sqlite", "db_path": str(tmp_path)})
 
-    rows = [_Row(date(2026, 5, 20), 84.6), _Row(date(2026, 5, 3), 83.9), _Row(date(2026, 5, 10), None)]
+    # get_for_period() returns rows ordered by day, so the fake does too
+    rows = [_Row(date(2026, 5, 3), 83.9), _Row(date(2026, 5, 10), None), _Row(date(2026, 5, 20), 84.6)]
 
     import garmindb.data.repositories.sqlite as sqlite_mod
 
@@ -27,3 +28,26 @@ def test_get_weight_series_maps_and_sorts(monkeypatch, tmp_path):
 
     series = repo.get_weight_series(date(2026, 5, 1), date(2026, 5, 31))
     assert series == [(date(2026, 5, 3), 83.9), (date(2026, 5, 20), 84.6)]
+
+
+def test_get_weight_series_logs_skipped_rows_once(monkeypatch, tmp_path, caplog):
+    repo = SQLiteHealthRepository({"db_type": "sqlite", "db_path": str(tmp_path)})
+
+    rows = [_Row(date(2026, 5, 3), 83.9), _Row(date(2026, 5, 10), None), _Row(date(2026, 5, 11), None)]
+
+    import garmindb.data.repositories.sqlite as sqlite_mod
+
+    class _FakeWeight:
+        @staticmethod
+        def get_for_period(db, start_ts, end_ts):
+            return rows
+
+    monkeypatch.setattr(sqlite_mod, "_import_weight_model", lambda: _FakeWeight, raising=False)
+    repo._garmin_db = object()
+
+    with caplog.at_level("DEBUG", logger=sqlite_mod.logger.name):
+        series = repo.get_weight_series(date(2026, 5, 1), date(2026, 5, 31))
+    assert series == [(date(2026, 5, 3), 83.9)]
+    skipped = [r for r in caplog.records if "Skipped" in r.getMessage()]
+    assert len(skipped) == 1
+    assert "2 weight rows" in skipped[0].getMessage()